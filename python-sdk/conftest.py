@@ -9,6 +9,7 @@ from airflow.utils.session import create_session
 
 from astro.constants import Database
 from astro.databases import create_database
+from astro.files.locations.base import get_conn_type
 from astro.table import MAX_TABLE_NAME_LENGTH, Table, TempTable
 
 DEFAULT_DATE = timezone.datetime(2016, 1, 1)
@@ -28,6 +29,13 @@ DATABASE_NAME_TO_CONN_ID = {
 }
 
 
+@pytest.fixture(autouse=True)
+def clear_conn_type_cache():
+    """Connections are patched per test, so the connection types cached by one test must not leak to others"""
+    yield
+    get_conn_type.cache_clear()
+
+
 @pytest.fixture
 def sample_dag():
     dag_id = create_unique_table_name(UNIQUE_HASH_SIZE)
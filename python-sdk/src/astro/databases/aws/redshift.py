@@ -47,6 +47,8 @@ NATIVE_PATHS_SUPPORTED_FILE_TYPES = {
     FileType.NDJSON: "JSON 'auto ignorecase'",
     FileType.PARQUET: "PARQUET",
 }
+REDSHIFT_MAX_BIND_PARAMETERS = 32767
+REDSHIFT_MAX_STATEMENT_BYTES = 16 * 1024 * 1024
 
 
 class RedshiftDatabase(BaseDatabase):
@@ -72,6 +74,8 @@ class RedshiftDatabase(BaseDatabase):
     NATIVE_PATHS = {
         FileLocation.S3: "load_s3_file_to_table",
     }
+    MAX_BIND_PARAMETERS = REDSHIFT_MAX_BIND_PARAMETERS
+    MAX_STATEMENT_BYTES = REDSHIFT_MAX_STATEMENT_BYTES
 
     illegal_column_name_chars: list[str] = ["."]
     illegal_column_name_chars_replacement: list[str] = ["_"]
@@ -95,8 +99,7 @@ class RedshiftDatabase(BaseDatabase):
     def hook(self) -> RedshiftSQLHook:
         """Retrieve Airflow hook to interface with the Redshift database."""
         kwargs = {}
-        _hook = RedshiftSQLHook(redshift_conn_id=self.conn_id, use_legacy_sql=False)
-        database = _hook.conn.schema
+        database = RedshiftSQLHook.get_connection(self.conn_id).schema
         # currently, kwargs might not get used because Airflow hook accept it but does not use it.
         if (database is None) and (self.table and self.table.metadata and self.table.metadata.database):
             kwargs.update({"schema": self.table.metadata.database})
@@ -156,13 +159,15 @@ class RedshiftDatabase(BaseDatabase):
         """
         self._assert_not_empty_df(source_dataframe)
 
+        # Insert many rows per statement instead of issuing one INSERT per row
         source_dataframe.to_sql(
             target_table.name,
             self.connection,
             index=False,
             schema=target_table.metadata.schema,
             if_exists=if_exists,
-            chunksize=chunk_size,
+            chunksize=self.get_multi_row_insert_chunk_size(source_dataframe, chunk_size),
+            method="multi",
         )
 
     @staticmethod
@@ -335,9 +340,8 @@ class RedshiftDatabase(BaseDatabase):
         :param if_exists: Overwrite file if exists. Default False
         :param native_support_kwargs: kwargs to be used by method involved in native support flow
         """
-        method_name = self.NATIVE_PATHS.get(source_file.location.location_type)
-        if method_name:
-            transfer_method = self.__getattribute__(method_name)
+        transfer_method = self.native_path_handlers.get(source_file.location.location_type)
+        if transfer_method:
             transfer_method(
                 source_file=source_file,
                 target_table=target_table,
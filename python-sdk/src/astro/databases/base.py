@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import warnings
 from abc import ABC
+from functools import lru_cache
 from typing import Any, Callable, Mapping
 
 import pandas as pd
@@ -11,7 +12,7 @@ from airflow.hooks.dbapi import DbApiHook
 from pandas.io.sql import SQLDatabase
 from sqlalchemy import column, insert, select
 from sqlalchemy.sql import ClauseElement
-from sqlalchemy.sql.elements import ColumnClause
+from sqlalchemy.sql.elements import ColumnClause, TextClause
 from sqlalchemy.sql.schema import Table as SqlaTable
 
 from astro.constants import (
@@ -40,6 +41,19 @@ from astro.table import BaseTable, Metadata
 from astro.utils.compat.functools import cached_property
 
 
+@lru_cache(maxsize=512)
+def get_autocommit_text_clause(sql: str) -> TextClause:
+    """
+    Return the autocommit Sqlalchemy text clause of a SQL statement.
+
+    Building a text clause parses its bind parameters, so we only do it once for statements which are run
+    repeatedly. Text clauses are not modified when executed, so they can be shared.
+
+    :param sql: SQL statement
+    """
+    return sqlalchemy.text(sql).execution_options(autocommit=True)
+
+
 class BaseDatabase(ABC):
     """
     Base class to represent all the Database interactions.
@@ -56,6 +70,9 @@ class BaseDatabase(ABC):
     _create_schema_statement: str = "CREATE SCHEMA IF NOT EXISTS {}"
     _drop_table_statement: str = "DROP TABLE IF EXISTS {}"
     _create_table_statement: str = "CREATE TABLE IF NOT EXISTS {} AS {}"
+    # Databases which can replace a table from a query in a single request set this template,
+    # the others drop the table before creating it.
+    _create_or_replace_table_statement: str = ""
     # Used to normalize the ndjson when appending fields in nested fields.
     # Example -
     #   ndjson - {'a': {'b': 'val'}}
@@ -65,6 +82,17 @@ class BaseDatabase(ABC):
     illegal_column_name_chars: list[str] = []
     illegal_column_name_chars_replacement: list[str] = []
     NATIVE_PATHS: dict[Any, Any] = {}
+    # Maximum number of parameters which can be bound to a single statement, when the database limits it
+    MAX_BIND_PARAMETERS: int | None = None
+    # Maximum size in bytes of a single statement, when the database limits it
+    MAX_STATEMENT_BYTES: int | None = None
+    # Estimated bytes a value takes in a statement on top of its in-memory size: placeholder, separators and
+    # the text of numbers and dates, which is longer than their binary representation
+    STATEMENT_BYTES_PER_VALUE = 32
+    # Databases whose merge_table accepts `use_key_range_predicates`, to let the target table be pruned
+    SUPPORTS_MERGE_KEY_RANGE_PREDICATES: bool = False
+    # Below this number of source rows, looking up the merge key ranges costs more than it saves
+    MERGE_KEY_RANGE_PREDICATES_MIN_ROWS: int = 10000
     DEFAULT_SCHEMA = SCHEMA
     NATIVE_LOAD_EXCEPTIONS: Any = DatabaseCustomError
     NATIVE_AUTODETECT_SCHEMA_CONFIG: Mapping[FileLocation, Mapping[str, list[FileType] | Callable]] = {}
@@ -93,6 +121,15 @@ class BaseDatabase(ABC):
         """Return an instance of the database-specific Airflow hook."""
         raise NotImplementedError
 
+    @cached_property
+    def native_path_handlers(self) -> dict[Any, Callable]:
+        """
+        Map each file location in NATIVE_PATHS to the bound method which loads it natively.
+
+        The methods are resolved once per instance, so subclasses overriding them are still honoured.
+        """
+        return {location: getattr(self, method_name) for location, method_name in self.NATIVE_PATHS.items()}
+
     @property
     def connection(self) -> sqlalchemy.engine.base.Connection:
         """Return a Sqlalchemy connection object for the given database."""
@@ -107,6 +144,7 @@ class BaseDatabase(ABC):
         self,
         sql: str | ClauseElement = "",
         parameters: dict | None = None,
+        connection: sqlalchemy.engine.base.Connection | None = None,
     ) -> Any:
         """
         Return the results to running a SQL statement.
@@ -116,15 +154,15 @@ class BaseDatabase(ABC):
 
         :param sql: Contains SQL query to be run against database
         :param parameters: Optional parameters to be used to render the query
+        :param connection: Optional Sqlalchemy connection to run the query on, a new one is opened by default
         """
+        connection = connection or self.connection
         # We need to autocommit=True to make sure the query runs. This is done exclusively for SnowflakeDatabase's
         # truncate method to reflect changes.
         if isinstance(sql, str):
-            result = self.connection.execute(
-                sqlalchemy.text(sql).execution_options(autocommit=True), parameters
-            )
+            result = connection.execute(get_autocommit_text_clause(sql), parameters)
         else:
-            result = self.connection.execute(sql, parameters)
+            result = connection.execute(sql, parameters)
         return result
 
     def run_sql(
@@ -159,13 +197,16 @@ class BaseDatabase(ABC):
             )
             sql = kwargs.get("sql_statement")  # type: ignore
 
+        # The pre and post queries share the connection of the main statement, so that session settings
+        # (e.g. query tags) apply to it and we only check out a single connection from the pool.
+        connection = self.connection
         for sql_query in query_modifier.pre_queries:
-            _ = self.run_single_sql_query(sql_query, parameters)
+            _ = self.run_single_sql_query(sql_query, parameters, connection=connection)
 
-        result = self.run_single_sql_query(sql, parameters)
+        result = self.run_single_sql_query(sql, parameters, connection=connection)
 
         for sql_query in query_modifier.post_queries:
-            _ = self.run_single_sql_query(sql_query, parameters)
+            _ = self.run_single_sql_query(sql_query, parameters, connection=connection)
 
         if handler:
             return handler(result)
@@ -380,6 +421,35 @@ class BaseDatabase(ABC):
         )
         self.run_sql(sql=statement, parameters=parameters, query_modifier=query_modifier)
 
+    def create_or_replace_table_from_select_statement(
+        self,
+        statement: str,
+        target_table: BaseTable,
+        parameters: dict | None = None,
+        query_modifier: QueryModifier = QueryModifier(),
+    ) -> None:
+        """
+        Replace the target table, if it exists, by the result rows of a query statement.
+
+        :param query_modifier: a query modifier that informs the pre and post query queries.
+        :param statement: SQL query statement
+        :param target_table: Destination table where results will be recorded.
+        :param parameters: (Optional) parameters to be used to render the SQL query
+        """
+        if not self._create_or_replace_table_statement:
+            self.drop_table(target_table)
+            self.create_table_from_select_statement(
+                statement=statement,
+                target_table=target_table,
+                parameters=parameters,
+                query_modifier=query_modifier,
+            )
+            return
+        statement = self._create_or_replace_table_statement.format(
+            self.get_table_qualified_name(target_table), statement
+        )
+        self.run_sql(sql=statement, parameters=parameters, query_modifier=query_modifier)
+
     def drop_table(self, table: BaseTable) -> None:
         """
         Delete a SQL table, if it exists.
@@ -658,11 +728,30 @@ class BaseDatabase(ABC):
             self.get_table_qualified_name(target_table),
             con=self.connection,
             if_exists=if_exists,
-            chunksize=chunk_size,
+            chunksize=self.get_multi_row_insert_chunk_size(source_dataframe, chunk_size),
             method="multi",
             index=False,
         )
 
+    def get_multi_row_insert_chunk_size(self, dataframe: pd.DataFrame, chunk_size: int) -> int:
+        """
+        Return how many rows of the dataframe to insert per multi-row ``INSERT`` statement.
+
+        Each row binds one parameter per column, so databases which limit the number of bound parameters
+        get smaller chunks than the requested size. Databases which limit the size of a statement get chunks
+        whose estimated size stays within half of that limit, leaving room for rows larger than the average.
+
+        :param dataframe: Dataframe to be inserted
+        :param chunk_size: Requested number of rows in each batch
+        """
+        if self.MAX_BIND_PARAMETERS:
+            chunk_size = min(chunk_size, self.MAX_BIND_PARAMETERS // len(dataframe.columns))
+        if self.MAX_STATEMENT_BYTES and len(dataframe):
+            row_bytes = dataframe.memory_usage(index=False, deep=True).sum() / len(dataframe)
+            row_bytes += self.STATEMENT_BYTES_PER_VALUE * len(dataframe.columns)
+            chunk_size = min(chunk_size, int(self.MAX_STATEMENT_BYTES / 2 // row_bytes))
+        return max(1, chunk_size)
+
     def append_table(
         self,
         source_table: BaseTable,
@@ -715,6 +804,29 @@ class BaseDatabase(ABC):
         """
         raise NotImplementedError
 
+    def get_merge_key_ranges(self, source_table: BaseTable, key_columns: list[str]) -> list[tuple[Any, Any]]:
+        """
+        Return the minimum and maximum values of each merge key in the source table, using a single query.
+        They can be added to the merge condition, so the database only scans the part of the target table
+        which may match. An empty list is returned when the source table has fewer rows than
+        ``MERGE_KEY_RANGE_PREDICATES_MIN_ROWS`` or when a key only holds nulls.
+
+        :param source_table: Contains the rows to be merged to the target table
+        :param key_columns: Merge key columns, quoted as needed by the database
+        """
+        aggregations = ", ".join(f"MIN({column}), MAX({column})" for column in key_columns)
+        row = self.run_sql(
+            f"SELECT COUNT(*), {aggregations} FROM {self.get_table_qualified_name(source_table)}",
+            handler=lambda result: result.fetchone(),
+        )
+        row_count, *bounds = row
+        key_ranges = list(zip(bounds[::2], bounds[1::2]))
+        if row_count < self.MERGE_KEY_RANGE_PREDICATES_MIN_ROWS or any(
+            lower is None or upper is None for lower, upper in key_ranges
+        ):
+            return []
+        return key_ranges
+
     def get_sqla_table(self, table: BaseTable) -> SqlaTable:
         """
         Return SQLAlchemy table instance
@@ -783,11 +895,22 @@ class BaseDatabase(ABC):
         :param schema: DB Schema - a namespace that contains named objects like (tables, functions, etc)
         :param assume_exists: If assume exists is True, does not check or attempt to create the schema
         """
+        if assume_exists or not schema or schema in self._existing_schemas:
+            return
         # We check if the schema exists first because snowflake will fail on a create schema query even if it
         # doesn't actually create a schema.
-        if not assume_exists and schema and not self.schema_exists(schema):
+        if not self.schema_exists(schema):
             statement = self._create_schema_statement.format(schema)
             self.run_sql(statement)
+        self._existing_schemas.add(schema)
+
+    @cached_property
+    def _existing_schemas(self) -> set[str]:
+        """
+        Schemas this instance already checked or created, so loading several chunks or tables into the same
+        schema only looks it up once.
+        """
+        return set()
 
     def schema_exists(self, schema: str) -> bool:
         """
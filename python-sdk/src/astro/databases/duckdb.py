@@ -82,7 +82,7 @@ class DuckdbDatabase(BaseDatabase):
         Handles database-specific logic to handle index for DuckDB.
         """
         joined_parameters = ",".join(parameters)
-        return f"CREATE UNIQUE INDEX merge_index ON {{{{table}}}}({joined_parameters})"
+        return f"CREATE UNIQUE INDEX IF NOT EXISTS merge_index ON {{{{table}}}}({joined_parameters})"
 
     def merge_table(
         self,
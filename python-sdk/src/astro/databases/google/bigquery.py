@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import io
+import logging
 import time
-from typing import Any, Callable, Mapping
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from airflow.providers.google.cloud.hooks.bigquery import BigQueryHook
 from airflow.providers.google.cloud.hooks.bigquery_dts import BiqQueryDataTransferServiceHook
 from google.api_core.exceptions import (
@@ -45,9 +52,15 @@ from astro.constants import (
 )
 from astro.databases.base import BaseDatabase
 from astro.exceptions import DatabaseCustomError
-from astro.files import File
+from astro.files import File, resolve_file_path_pattern
+from astro.files.types import get_filetype
 from astro.options import LoadOptions
-from astro.settings import BIGQUERY_SCHEMA, BIGQUERY_SCHEMA_LOCATION
+from astro.settings import (
+    BIGQUERY_MAX_CONCURRENT_LOAD_JOBS,
+    BIGQUERY_MAX_PARALLEL_S3_TRANSFERS,
+    BIGQUERY_SCHEMA,
+    BIGQUERY_SCHEMA_LOCATION,
+)
 from astro.table import BaseTable, Metadata
 from astro.utils.compat.functools import cached_property
 
@@ -58,6 +71,25 @@ NATIVE_PATHS_SUPPORTED_FILE_TYPES = {
     FileType.PARQUET: "PARQUET",
 }
 BIGQUERY_WRITE_DISPOSITION = {"replace": "WRITE_TRUNCATE", "append": "WRITE_APPEND"}
+# https://cloud.google.com/bigquery/quotas#load_jobs
+BIGQUERY_MAX_SOURCE_URIS_PER_LOAD_JOB = 10000
+
+# Types of values pandas infers for ``object`` columns that pyarrow can serialise to a Parquet column
+PARQUET_COMPATIBLE_OBJECT_COLUMN_TYPES = {
+    "string",
+    "empty",
+    "boolean",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "decimal",
+    "date",
+    "datetime",
+    "time",
+    "bytes",
+}
+# Seconds during which the AWS credentials of S3 to Bigquery transfers are reused
+S3_CREDENTIALS_CACHE_TTL_SECONDS = 300
 
 
 class BigqueryDatabase(BaseDatabase):
@@ -67,6 +99,7 @@ class BigqueryDatabase(BaseDatabase):
     """
 
     DEFAULT_SCHEMA = BIGQUERY_SCHEMA
+    _create_or_replace_table_statement: str = "CREATE OR REPLACE TABLE {} AS {}"
     NATIVE_PATHS = {
         FileLocation.GS: "load_gs_file_to_table",
         FileLocation.S3: "load_s3_file_to_table",
@@ -87,6 +120,7 @@ class BigqueryDatabase(BaseDatabase):
 
     illegal_column_name_chars: list[str] = ["."]
     illegal_column_name_chars_replacement: list[str] = ["_"]
+    SUPPORTS_MERGE_KEY_RANGE_PREDICATES = True
     NATIVE_LOAD_EXCEPTIONS: Any = (
         GoogleNotFound,
         ClientError,
@@ -215,6 +249,74 @@ class BigqueryDatabase(BaseDatabase):
         """
         return "RETURN"
 
+    def submit_pandas_dataframe_load(
+        self,
+        source_dataframe: pd.DataFrame,
+        target_table: BaseTable,
+        if_exists: LoadExistStrategy = "replace",
+    ) -> bigquery.LoadJob:
+        """
+        Start a job loading the dataframe's contents into a table, without waiting for it to complete.
+        The caller is responsible for waiting on the returned job, by calling its ``result`` method.
+
+        :param source_dataframe: Dataframe to be loaded
+        :param target_table: Table in which the dataframe will be loaded
+        :param if_exists: Strategy to be used in case the target table already exists.
+        """
+        # The dataframe is serialised to Parquet rather than handed to pandas-gbq: the payload is columnar and
+        # compressed, so it is smaller on the wire and BigQuery does not need to parse it row by row.
+        source_dataframe = coerce_mixed_object_columns(source_dataframe)
+        arrow_table = pa.Table.from_pandas(source_dataframe, preserve_index=False)
+        buffer = io.BytesIO()
+        pq.write_table(arrow_table, buffer, compression="snappy")
+        buffer.seek(0)
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=BIGQUERY_WRITE_DISPOSITION[if_exists],
+        )
+        return self.hook.get_client().load_table_from_file(
+            buffer, destination=self.get_table_qualified_name(target_table), job_config=job_config
+        )
+
+    def load_pandas_dataframes_to_table(
+        self,
+        source_dataframes: Iterable[pd.DataFrame],
+        target_table: BaseTable,
+        if_exists: LoadExistStrategy = "replace",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Load the contents of many dataframes into a table, running up to ``BIGQUERY_MAX_CONCURRENT_LOAD_JOBS``
+        load jobs at the same time. Each job counts towards the daily load jobs quota of the table.
+        If the table already exists, the first job appends or replaces the content, depending on the value of
+        `if_exists`, and the following ones append to it.
+
+        :param source_dataframes: Dataframes to be loaded, they are only consumed as jobs are submitted
+        :param target_table: Table in which the dataframes will be loaded
+        :param if_exists: Strategy to be used in case the target table already exists.
+        :param chunk_size: Specify the number of rows in each batch to be written at a time.
+        """
+        # Unlike pandas-gbq, load jobs do not create the dataset of the table
+        self.create_schema_if_needed(target_table.metadata.schema)
+        running_jobs: deque[bigquery.LoadJob] = deque()
+        for source_dataframe in source_dataframes:
+            self._assert_not_empty_df(source_dataframe)
+            for start in range(0, len(source_dataframe), chunk_size):
+                job = self.submit_pandas_dataframe_load(
+                    source_dataframe[start : start + chunk_size], target_table, if_exists=if_exists
+                )
+                if if_exists == "replace":
+                    # The table must be truncated before appending to it, or the appended rows could be lost
+                    job.result()
+                    if_exists = "append"
+                    continue
+                running_jobs.append(job)
+                if len(running_jobs) >= BIGQUERY_MAX_CONCURRENT_LOAD_JOBS:
+                    running_jobs.popleft().result()
+        # BigQuery runs the jobs concurrently, so waiting on them in turn only takes as long as the slowest
+        while running_jobs:
+            running_jobs.popleft().result()
+
     def load_pandas_dataframe_to_table(
         self,
         source_dataframe: pd.DataFrame,
@@ -231,19 +333,32 @@ class BigqueryDatabase(BaseDatabase):
         :param if_exists: Strategy to be used in case the target table already exists.
         :param chunk_size: Specify the number of rows in each batch to be written at a time.
         """
-        self._assert_not_empty_df(source_dataframe)
+        self.load_pandas_dataframes_to_table(
+            [source_dataframe], target_table, if_exists=if_exists, chunk_size=chunk_size
+        )
 
-        try:
-            creds = self.hook._get_credentials()  # skipcq PYL-W021
-        except AttributeError:
-            # Details: https://github.com/astronomer/astro-sdk/issues/703
-            creds = self.hook.get_credentials()
-        source_dataframe.to_gbq(
-            self.get_table_qualified_name(target_table),
+    def load_file_to_table_using_pandas(
+        self,
+        input_file: File,
+        output_table: BaseTable,
+        normalize_config: dict | None = None,
+        if_exists: LoadExistStrategy = "replace",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        logging.info("Loading file(s) with Pandas...")
+        input_files = resolve_file_path_pattern(
+            input_file.path,
+            input_file.conn_id,
+            normalize_config=normalize_config,
+            filetype=input_file.type.name,
+            load_options=input_file.load_options,
+        )
+        # The next file is read while the load jobs of the previous ones are still running
+        self.load_pandas_dataframes_to_table(
+            (self.get_dataframe_from_file(file) for file in input_files),
+            output_table,
             if_exists=if_exists,
-            chunksize=chunk_size,
-            project_id=self.hook.project_id,
-            credentials=creds,
+            chunk_size=chunk_size,
         )
 
     def create_schema_if_needed(self, schema: str | None) -> None:
@@ -270,6 +385,7 @@ class BigqueryDatabase(BaseDatabase):
         source_to_target_columns_map: dict[str, str],
         target_conflict_columns: list[str],
         if_conflicts: MergeConflictStrategy = "exception",
+        use_key_range_predicates: bool = False,
     ) -> None:
         """
         Merge the source table rows into a destination table.
@@ -280,6 +396,9 @@ class BigqueryDatabase(BaseDatabase):
         :param source_to_target_columns_map: Dict of target_table columns names to source_table columns names
         :param target_conflict_columns: List of cols where we expect to have a conflict while combining
         :param if_conflicts: The strategy to be applied if there are conflicts.
+        :param use_key_range_predicates: Restrict the merge condition to the range of values of each conflict
+            column in the source table, so BigQuery can prune the target table partitions and clustered
+            blocks.
         """
 
         source_columns = list(source_to_target_columns_map.keys())
@@ -288,10 +407,19 @@ class BigqueryDatabase(BaseDatabase):
         target_table_name = self.get_table_qualified_name(target_table)
         source_table_name = self.get_table_qualified_name(source_table)
 
+        merge_conditions = [f"T.{col}=S.{col}" for col in target_conflict_columns]
+        parameters = {}
+        if use_key_range_predicates:
+            key_ranges = self.get_merge_key_ranges(source_table, target_conflict_columns)
+            for i, (col, (lower, upper)) in enumerate(zip(target_conflict_columns, key_ranges)):
+                merge_conditions.append(f"T.{col}>=:merge_key_min_{i} AND T.{col}<=:merge_key_max_{i}")
+                parameters[f"merge_key_min_{i}"] = lower
+                parameters[f"merge_key_max_{i}"] = upper
+
         insert_statement = f"INSERT ({', '.join(target_columns)}) VALUES ({', '.join(source_columns)})"
         merge_statement = (
             f"MERGE {target_table_name} T USING {source_table_name} S"
-            f" ON {' AND '.join(f'T.{col}=S.{col}' for col in target_conflict_columns)}"
+            f" ON {' AND '.join(merge_conditions)}"
             f" WHEN NOT MATCHED BY TARGET THEN {insert_statement}"
         )
         if if_conflicts == "update":
@@ -305,7 +433,7 @@ class BigqueryDatabase(BaseDatabase):
             # Note: Ignoring below sql injection warning, as we validate that the table columns exist beforehand.
             update_statement = f"UPDATE SET {update_statement_map}"  # skipcq BAN-B608
             merge_statement += f" WHEN MATCHED THEN {update_statement}"
-        self.run_sql(sql=merge_statement)
+        self.run_sql(sql=merge_statement, parameters=parameters)
 
     def is_native_autodetect_schema_available(  # skipcq: PYL-R0201
         self, file: File  # skipcq: PYL-W0613
@@ -366,9 +494,8 @@ class BigqueryDatabase(BaseDatabase):
         :param if_exists: Overwrite file if exists. Default False
         :param native_support_kwargs: kwargs to be used by method involved in native support flow
         """
-        method_name = self.NATIVE_PATHS.get(source_file.location.location_type)
-        if method_name:
-            transfer_method = self.__getattribute__(method_name)
+        transfer_method = self.native_path_handlers.get(source_file.location.location_type)
+        if transfer_method:
             transfer_method(
                 source_file=source_file,
                 target_table=target_table,
@@ -382,6 +509,34 @@ class BigqueryDatabase(BaseDatabase):
                 f"for {source_file.location.location_type} to bigquery."
             )
 
+    @staticmethod
+    def get_gs_source_uris(source_file: File) -> list[str]:
+        """
+        Build the list of GCS URIs to be loaded by BigQuery load jobs.
+
+        Prefixes are resolved to the objects they contain, since BigQuery only expands ``*`` wildcards itself.
+        Objects of another file type stored under the prefix, such as ``_SUCCESS`` markers, are skipped.
+
+        :param source_file: File, prefix or wildcard pattern stored in GCS
+        """
+        if not source_file.is_pattern() or "*" in source_file.path:
+            return [source_file.path]
+
+        filetype = source_file.type.name
+        source_uris = [
+            file.path
+            for file in resolve_file_path_pattern(
+                source_file.path,
+                source_file.conn_id,
+                filetype=filetype,
+                load_options=source_file.load_options,
+            )
+            if _is_filetype(file.path, filetype)
+        ]
+        if not source_uris:
+            raise FileNotFoundError(f"No {filetype} file found for path/pattern '{source_file.path}'")
+        return source_uris
+
     def load_gs_file_to_table(
         self,
         source_file: File,
@@ -399,9 +554,10 @@ class BigqueryDatabase(BaseDatabase):
         :param native_support_kwargs: kwargs to be used by method involved in native support flow
         """
         native_support_kwargs = native_support_kwargs or {}
+        source_uris = self.get_gs_source_uris(source_file)
 
         load_job_config = {
-            "sourceUris": [source_file.path],
+            "sourceUris": source_uris,
             "destinationTable": {
                 "projectId": self.get_project_id(target_table),
                 "datasetId": target_table.metadata.schema,
@@ -421,15 +577,23 @@ class BigqueryDatabase(BaseDatabase):
         # https://cloud.google.com/bigquery/docs/reference/rest/v2/Job#JobConfigurationLoad
         load_job_config.update(kwargs)
 
-        job_config = {
-            "jobType": "LOAD",
-            "load": load_job_config,
-            "labels": {"target_table": target_table.name},
-        }
-
-        self.hook.insert_job(
-            configuration=job_config,
-        )
+        source_uris = kwargs.get("sourceUris", source_uris)
+        write_disposition = load_job_config["writeDisposition"]
+        for index in range(0, len(source_uris), BIGQUERY_MAX_SOURCE_URIS_PER_LOAD_JOB):
+            job_config = {
+                "jobType": "LOAD",
+                "load": {
+                    **load_job_config,
+                    "sourceUris": source_uris[index : index + BIGQUERY_MAX_SOURCE_URIS_PER_LOAD_JOB],
+                    # Only the first job may truncate the table, or it would discard the previous batches
+                    "writeDisposition": write_disposition if index == 0 else "WRITE_APPEND",
+                },
+                "labels": {"target_table": target_table.name},
+            }
+
+            self.hook.insert_job(
+                configuration=job_config,
+            )
 
     def load_s3_file_to_table(
         self,
@@ -453,14 +617,43 @@ class BigqueryDatabase(BaseDatabase):
         native_support_kwargs = native_support_kwargs or {}
 
         project_id = self.get_project_id(target_table)
-        transfer = S3ToBigqueryDataTransfer(
-            target_table=target_table,
-            source_file=source_file,
-            project_id=project_id,
-            native_support_kwargs=native_support_kwargs,
-            **kwargs,
-        )
-        transfer.run()
+        # A prefix is split into one transfer per file, so they can run concurrently rather than serially
+        # falling back to pandas. Wildcards are expanded by the data transfer service itself.
+        if source_file.is_pattern() and "*" not in source_file.path:
+            source_files = resolve_file_path_pattern(
+                source_file.path,
+                source_file.conn_id,
+                filetype=source_file.type.name,
+                load_options=source_file.load_options,
+            )
+        else:
+            source_files = [source_file]
+
+        # The transfers share one hook, so the credentials and gRPC channel are set up once, not per file.
+        # Its client is created up front since the hook creates it lazily without a lock.
+        client = BiqQueryDataTransferServiceHook(gcp_conn_id=target_table.conn_id)
+        client.get_conn()
+
+        def run_transfer(file: File) -> None:
+            transfer = S3ToBigqueryDataTransfer(
+                target_table=target_table,
+                source_file=file,
+                project_id=project_id,
+                native_support_kwargs=native_support_kwargs,
+                client=client,
+                **kwargs,
+            )
+            transfer.run()
+
+        if len(source_files) == 1:
+            run_transfer(source_files[0])
+            return
+
+        max_workers = min(BIGQUERY_MAX_PARALLEL_S3_TRANSFERS, len(source_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_transfer, file) for file in source_files]
+            for future in futures:
+                future.result()
 
     def get_project_id(self, target_table) -> str:
         """
@@ -541,6 +734,62 @@ class BigqueryDatabase(BaseDatabase):
         return f"{self.openlineage_dataset_namespace()}:{self.openlineage_dataset_name(table=table)}"
 
 
+def _is_filetype(path: str, filetype: FileType) -> bool:
+    """Check if the extension of the path matches the given file type."""
+    try:
+        return get_filetype(path) == filetype
+    except ValueError:
+        return False
+
+
+def coerce_mixed_object_columns(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the dataframe with the ``object`` columns holding values of mixed types converted to strings, as
+    pandas-gbq used to do. Parquet columns have a single type, so pyarrow cannot serialise these columns as
+    they are. Missing values are kept.
+
+    :param dataframe: Dataframe to be loaded to BigQuery
+    """
+    mixed_columns = [
+        name
+        for name, column in dataframe.items()
+        if pd.api.types.is_object_dtype(column.dtype)
+        and pd.api.types.infer_dtype(column, skipna=True) not in PARQUET_COMPATIBLE_OBJECT_COLUMN_TYPES
+    ]
+    if not mixed_columns:
+        return dataframe
+    dataframe = dataframe.copy(deep=False)
+    for name in mixed_columns:
+        column = dataframe[name]
+        dataframe[name] = column.where(column.isna(), column.astype(str))
+    return dataframe
+
+
+def get_s3_credentials(conn_id: str | None) -> tuple[str, str]:
+    """
+    Return the access key and secret key of the given AWS connection, shared by all the S3 to Bigquery
+    transfers. This avoids querying the Airflow metadata database for every transfer using the same
+    connection. The credentials are only reused for ``S3_CREDENTIALS_CACHE_TTL_SECONDS``, so rotated keys are
+    picked up by long-lived workers without a restart.
+
+    :param conn_id: Airflow connection ID of the source S3 file
+    """
+    return _get_s3_credentials(conn_id, int(time.monotonic() // S3_CREDENTIALS_CACHE_TTL_SECONDS))
+
+
+@lru_cache(maxsize=128)
+def _get_s3_credentials(conn_id: str | None, ttl_bucket: int) -> tuple[str, str]:  # skipcq: PYL-W0613
+    """
+    Look up the credentials of the AWS connection. ``ttl_bucket`` is only part of the cache key, so the
+    cached credentials expire when it changes.
+    """
+    from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+
+    hook = S3Hook(aws_conn_id=conn_id) if conn_id else S3Hook()
+    credentials = hook.get_credentials()
+    return credentials.access_key, credentials.secret_key
+
+
 class S3ToBigqueryDataTransfer:
     """
     Create and run Datatransfer job from S3 to Bigquery
@@ -550,6 +799,7 @@ class S3ToBigqueryDataTransfer:
     :param project_id: Bigquery project id
     :param poll_duration: sleep duration between two consecutive job status checks. Unit - seconds. Default 1 sec.
     :param native_support_kwargs: kwargs to be used by method involved in native support flow
+    :param client: Data Transfer Service hook shared with other transfers. Created if not given.
     """
 
     def __init__(
@@ -559,15 +809,14 @@ class S3ToBigqueryDataTransfer:
         project_id: str,
         poll_duration: int = 1,
         native_support_kwargs: dict | None = None,
+        client: BiqQueryDataTransferServiceHook | None = None,
         **kwargs,
     ):
-        self.client = BiqQueryDataTransferServiceHook(gcp_conn_id=target_table.conn_id)
+        self.client = client or BiqQueryDataTransferServiceHook(gcp_conn_id=target_table.conn_id)
         self.target_table = target_table
         self.source_file = source_file
 
-        aws = source_file.location.hook.get_credentials()
-        self.s3_access_key = aws.access_key
-        self.s3_secret_key = aws.secret_key
+        self.s3_access_key, self.s3_secret_key = get_s3_credentials(source_file.conn_id)
         file_types_to_bigquery_format = {
             FileType.CSV: "CSV",
             FileType.NDJSON: "JSON",
@@ -657,7 +906,10 @@ class S3ToBigqueryDataTransfer:
 
     def run_transfer_now(self, transfer_config_id: str):
         """Run transfer job on Google cloud"""
-        start_time = timestamp_pb2.Timestamp(seconds=int(time.time() + 10))
+        # The transfer service rejects requested run times in the future, so ask for the run to start right
+        # away instead of scheduling it a few seconds ahead.
+        start_time = timestamp_pb2.Timestamp()
+        start_time.GetCurrentTime()
         run_info = self.client.start_manual_transfer_runs(
             transfer_config_id=transfer_config_id,
             project_id=self.project_id,
@@ -18,6 +18,7 @@ DEFAULT_CONN_ID = MySqlHook.default_conn_name
 
 class MysqlDatabase(BaseDatabase):
     DEFAULT_SCHEMA = MYSQL_SCHEMA
+    MAX_BIND_PARAMETERS = 65535
 
     _create_schema_statement: str = (
         "CREATE SCHEMA IF NOT EXISTS {} "
@@ -38,7 +39,7 @@ class MysqlDatabase(BaseDatabase):
     @cached_property
     def hook(self) -> MySqlHook:
         """Retrieve Airflow hook to interface with the mysql database."""
-        conn = MySqlHook(mysql_conn_id=self.conn_id).get_connection(self.conn_id)
+        conn = MySqlHook.get_connection(self.conn_id)
         kwargs = {}
         if conn.schema is None:
             if (
@@ -111,7 +112,7 @@ class MysqlDatabase(BaseDatabase):
             con=self.sqlalchemy_engine,
             schema=target_table.metadata.schema,
             if_exists=if_exists,
-            chunksize=chunk_size,
+            chunksize=self.get_multi_row_insert_chunk_size(source_dataframe, chunk_size),
             method="multi",
             index=False,
         )
@@ -73,6 +73,19 @@ NATIVE_AUTODETECT_SCHEMA_SUPPORTED_FILE_LOCATIONS = {FileLocation.GS, FileLocati
 
 COPY_INTO_COMMAND_FAIL_STATUS = "LOAD_FAILED"
 
+# Snowflake column types of dataframe ``object`` columns, by the type of values pandas infers they hold
+SNOWFLAKE_OBJECT_COLUMN_TYPES = {
+    "boolean": "BOOLEAN",
+    "integer": "NUMBER",
+    "floating": "FLOAT",
+    "mixed-integer-float": "FLOAT",
+    "date": "DATE",
+    "datetime": "TIMESTAMP_NTZ",
+    "time": "TIME",
+    "bytes": "BINARY",
+}
+SNOWFLAKE_MAX_NUMBER_SCALE = 37
+
 
 @dataclass
 class SnowflakeFileFormat:
@@ -245,6 +258,7 @@ class SnowflakeDatabase(BaseDatabase):
 
     LOAD_OPTIONS_CLASS_NAME = ("SnowflakeLoadOptions",)
 
+    SUPPORTS_MERGE_KEY_RANGE_PREDICATES = True
     NATIVE_LOAD_EXCEPTIONS: Any = (
         DatabaseCustomError,
         ProgrammingError,
@@ -260,6 +274,7 @@ class SnowflakeDatabase(BaseDatabase):
         RequestTimeoutError,
     )
     DEFAULT_SCHEMA = SNOWFLAKE_SCHEMA
+    _create_or_replace_table_statement: str = "CREATE OR REPLACE TABLE {} AS {}"
 
     METADATA_COLUMNS_DATATYPE = {
         "METADATA$FILENAME": "VARCHAR",
@@ -473,6 +488,14 @@ class SnowflakeDatabase(BaseDatabase):
     def create_table(self, table: BaseTable, *args, **kwargs):
         """Override create_table to add metadata columns to the table if specified in load_options"""
         super().create_table(table, *args, **kwargs)
+        self.add_metadata_columns(table)
+
+    def add_metadata_columns(self, table: BaseTable) -> None:
+        """
+        Add the metadata columns specified in load_options to the table, if they are not there yet.
+
+        :param table: The table to which the metadata columns are added.
+        """
         if self.load_options is None or not self.load_options.metadata_columns:
             return
         table_name = self.get_table_qualified_name(table)
@@ -545,6 +568,30 @@ class SnowflakeDatabase(BaseDatabase):
         """
         return any(col for col in cols if not col.islower() and not col.isupper())
 
+    def get_create_or_replace_table_statement(self, table: BaseTable, dataframe: pd.DataFrame) -> str:
+        """
+        Return the statement creating or replacing the table, with columns matching the dataframe's dtypes.
+        Identifiers are quoted the same way `write_pandas` quotes them when loading the dataframe.
+
+        :param table: The table to be created.
+        :param dataframe: Dataframe used to infer the new table columns.
+        """
+        quote_identifiers = self.use_quotes(dataframe)
+
+        def identifier(name: str) -> str:
+            return f'"{name}"' if quote_identifiers else name
+
+        qualified_name = ".".join(
+            identifier(name)
+            for name in (table.metadata.database, table.metadata.schema, table.name.upper())
+            if name
+        )
+        columns = ", ".join(
+            f"{identifier(str(name))} {get_snowflake_column_type(column)}"
+            for name, column in dataframe.items()
+        )
+        return f"CREATE OR REPLACE TABLE {qualified_name} ({columns})"
+
     def create_table_using_schema_autodetection(
         self,
         table: BaseTable,
@@ -768,10 +815,17 @@ class SnowflakeDatabase(BaseDatabase):
         self._assert_not_empty_df(source_dataframe)
 
         auto_create_table = False
-        if not self.table_exists(target_table):
-            auto_create_table = True
-        elif if_exists == "replace":
+        if if_exists == "replace" and target_table.columns:
+            # The columns declared by the user take precedence over the types inferred from the dataframe
+            self.drop_table(target_table)
             self.create_table(target_table, dataframe=source_dataframe)
+        elif if_exists == "replace":
+            # A single DDL statement, instead of checking if the table exists and loading the dataframe twice
+            # to infer the table schema.
+            self.run_sql(self.get_create_or_replace_table_statement(target_table, source_dataframe))
+            self.add_metadata_columns(target_table)
+        elif not self.table_exists(target_table):
+            auto_create_table = True
 
         # We are changing the case of table name to ease out on the requirements to add quotes in raw queries.
         # ToDO - Currently, we cannot to append using load_file to a table name which is having name in lower case.
@@ -864,6 +918,7 @@ class SnowflakeDatabase(BaseDatabase):
         source_to_target_columns_map: dict[str, str],
         target_conflict_columns: list[str],
         if_conflicts: MergeConflictStrategy = "exception",
+        use_key_range_predicates: bool = False,
     ) -> None:
         """
         Merge the source table rows into a destination table.
@@ -874,6 +929,8 @@ class SnowflakeDatabase(BaseDatabase):
         :param source_to_target_columns_map: Dict of target_table columns names to source_table columns names
         :param target_conflict_columns: List of cols where we expect to have a conflict while combining
         :param if_conflicts: The strategy to be applied if there are conflicts.
+        :param use_key_range_predicates: Restrict the merge condition to the range of values of each conflict
+            column in the source table, so Snowflake can prune the target table micro-partitions.
         """
         statement, params = self._build_merge_sql(
             source_table=source_table,
@@ -881,6 +938,7 @@ class SnowflakeDatabase(BaseDatabase):
             source_to_target_columns_map=source_to_target_columns_map,
             target_conflict_columns=target_conflict_columns,
             if_conflicts=if_conflicts,
+            use_key_range_predicates=use_key_range_predicates,
         )
         self.run_sql(sql=statement, parameters=params)
 
@@ -891,6 +949,7 @@ class SnowflakeDatabase(BaseDatabase):
         source_to_target_columns_map: dict[str, str],
         target_conflict_columns: list[str],
         if_conflicts: MergeConflictStrategy = "exception",
+        use_key_range_predicates: bool = False,
     ):
         """Build the SQL statement for Merge operation"""
         source_table_name = source_table.name
@@ -932,6 +991,20 @@ class SnowflakeDatabase(BaseDatabase):
             f"{wrap_identifier(k)}={wrap_identifier(v)}"
             for k, v in zip(merge_target_dict.keys(), merge_source_dict.keys())
         )
+        key_range_params = {}
+        if use_key_range_predicates:
+            key_columns = [
+                f"{source_identifier_enclosure}{col}{source_identifier_enclosure}"
+                for col in target_conflict_columns
+            ]
+            key_ranges = self.get_merge_key_ranges(source_table, key_columns)
+            for i, (lower, upper) in enumerate(key_ranges):
+                merge_clauses += (
+                    f" AND {wrap_identifier(f'merge_clause_target_{i}')}>=:merge_key_min_{i}"
+                    f" AND {wrap_identifier(f'merge_clause_target_{i}')}<=:merge_key_max_{i}"
+                )
+                key_range_params[f"merge_key_min_{i}"] = lower
+                key_range_params[f"merge_key_max_{i}"] = upper
         statement = f"merge into {target_table_identifier} using {source_table_identifier} on {merge_clauses}"
 
         values_to_check = [target_table_name, source_table_name]
@@ -962,6 +1035,7 @@ class SnowflakeDatabase(BaseDatabase):
         params = {
             **merge_target_dict,
             **merge_source_dict,
+            **key_range_params,
             "source_table": source_table_param,
             "target_table": target_table_param,
         }
@@ -1100,6 +1174,53 @@ class SnowflakeDatabase(BaseDatabase):
         self.run_sql(f"TRUNCATE {self.get_table_qualified_name(table)}")
 
 
+def get_snowflake_column_type(column: pd.Series) -> str:
+    """
+    Return the Snowflake column type used to store the values of the given dataframe column.
+
+    Columns of the ``object`` dtype are typed after the values they hold, so dates and decimals are not
+    stored as text. Other dtypes without a matching Snowflake type are stored as text.
+
+    :param column: Column of a dataframe
+    """
+    dtype = column.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "NUMBER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "FLOAT"
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return "TIMESTAMP_TZ"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP_NTZ"
+    if pd.api.types.is_object_dtype(dtype):
+        inferred_type = pd.api.types.infer_dtype(column, skipna=True)
+        if inferred_type == "decimal":
+            return f"NUMBER(38, {get_decimal_scale(column)})"
+        if inferred_type in SNOWFLAKE_OBJECT_COLUMN_TYPES:
+            return SNOWFLAKE_OBJECT_COLUMN_TYPES[inferred_type]
+    elif not pd.api.types.is_string_dtype(dtype):
+        logging.warning(
+            "Column %s of dtype %s has no matching Snowflake type, it is created as VARCHAR. "
+            "Declare the table columns to choose its type.",
+            column.name,
+            dtype,
+        )
+    return "VARCHAR"
+
+
+def get_decimal_scale(column: pd.Series) -> int:
+    """
+    Return the largest number of digits after the decimal point among the decimals of the column.
+
+    :param column: Column of a dataframe holding ``decimal.Decimal`` values
+    """
+    exponents = [value.as_tuple().exponent for value in column.dropna() if value.is_finite()]
+    scale = max((-exponent for exponent in exponents), default=0)
+    return min(max(scale, 0), SNOWFLAKE_MAX_NUMBER_SCALE)
+
+
 def wrap_identifier(inp: str) -> str:
     return f"Identifier(:{inp})"
 
@@ -1,36 +1,62 @@
 from __future__ import annotations
 
+import csv
 import socket
+import sqlite3
+from typing import Any
 
+import pandas as pd
 from airflow.providers.sqlite.hooks.sqlite import SqliteHook
 from sqlalchemy import MetaData as SqlaMetaData, create_engine
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.sql.schema import Table as SqlaTable
 
-from astro.constants import MergeConflictStrategy
+from astro.constants import (
+    DEFAULT_CHUNK_SIZE,
+    FileLocation,
+    FileType,
+    LoadExistStrategy,
+    MergeConflictStrategy,
+)
 from astro.databases.base import BaseDatabase
-from astro.options import LoadOptions
+from astro.exceptions import DatabaseCustomError
+from astro.files import File, resolve_file_path_pattern
+from astro.options import SqliteLoadOptions
 from astro.table import BaseTable, Metadata
-from astro.utils.compat.functools import cached_property
+from astro.utils.compat.functools import cache, cached_property
 
 DEFAULT_CONN_ID = SqliteHook.default_conn_name
 
 
+@cache
+def get_sqlite_engine(database_path: str) -> Engine:
+    """
+    Return the SQLAlchemy engine of the given Sqlite database file, so every ``SqliteDatabase`` pointing to
+    the same file shares a single engine and its connection pool.
+
+    :param database_path: Path to the Sqlite database file
+    """
+    return create_engine(f"sqlite:///{database_path}")
+
+
 class SqliteDatabase(BaseDatabase):
     """
     Handle interactions with Sqlite databases. If this class is successful, we should not have any Sqlite-specific
     logic in other parts of our code-base.
     """
 
+    LOAD_OPTIONS_CLASS_NAME = ("SqliteLoadOptions",)
+    NATIVE_LOAD_EXCEPTIONS: Any = (DatabaseCustomError, sqlite3.DatabaseError, csv.Error)
+
     def __init__(
         self,
         conn_id: str = DEFAULT_CONN_ID,
         table: BaseTable | None = None,
-        load_options: LoadOptions | None = None,
+        load_options: SqliteLoadOptions | None = None,
     ):
         super().__init__(conn_id)
         self.table = table
-        self.load_options = load_options
+        self.load_options: SqliteLoadOptions | None = load_options
 
     @property
     def sql_type(self) -> str:
@@ -47,7 +73,7 @@ class SqliteDatabase(BaseDatabase):
         # Airflow uses sqlite3 library and not SqlAlchemy for SqliteHook
         # and it only uses the hostname directly.
         airflow_conn = self.hook.get_connection(self.conn_id)
-        return create_engine(f"sqlite:///{airflow_conn.host}")
+        return get_sqlite_engine(airflow_conn.host)
 
     @property
     def default_metadata(self) -> Metadata:
@@ -91,7 +117,102 @@ class SqliteDatabase(BaseDatabase):
         Handles database-specific logic to handle index for Sqlite.
         """
         joined_parameters = ",".join(parameters)
-        return f"CREATE UNIQUE INDEX merge_index ON {{{{table}}}}({joined_parameters})"
+        return f"CREATE UNIQUE INDEX IF NOT EXISTS merge_index ON {{{{table}}}}({joined_parameters})"
+
+    def load_pandas_dataframe_to_table(
+        self,
+        source_dataframe: pd.DataFrame,
+        target_table: BaseTable,
+        if_exists: LoadExistStrategy = "replace",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Create a table with the dataframe's contents.
+        If the table already exists, append or replace the content, depending on the value of `if_exists`.
+
+        Sqlite commits every statement run outside a transaction and limits the number of variables bound to a
+        statement, so the rows are inserted with ``executemany`` inside a single transaction instead of using
+        multi-row ``INSERT`` statements.
+
+        :param source_dataframe: Local or remote filepath
+        :param target_table: Table in which the file will be loaded
+        :param if_exists: Strategy to be used in case the target table already exists.
+        :param chunk_size: Specify the number of rows in each batch to be written at a time.
+        """
+        self._assert_not_empty_df(source_dataframe)
+
+        with self.sqlalchemy_engine.begin() as connection:
+            source_dataframe.to_sql(
+                self.get_table_qualified_name(target_table),
+                con=connection,
+                if_exists=if_exists,
+                chunksize=chunk_size,
+                index=False,
+            )
+
+    def is_native_load_file_available(
+        self,
+        source_file: File,
+        target_table: BaseTable,  # skipcq PYL-W0613
+    ) -> bool:
+        """
+        Local CSV files without custom load options can be streamed straight into Sqlite, if the user opted in
+        with ``SqliteLoadOptions(use_native_csv_load=True)``.
+
+        :param source_file: File from which we need to transfer data
+        :param target_table: Table that needs to be populated with file data
+        """
+        return (
+            self.load_options is not None
+            and self.load_options.use_native_csv_load
+            and source_file.location.location_type == FileLocation.LOCAL
+            and source_file.type.name == FileType.CSV
+            and not source_file.load_options
+        )
+
+    def load_file_to_table_natively(
+        self,
+        source_file: File,
+        target_table: BaseTable,
+        if_exists: LoadExistStrategy = "replace",
+        native_support_kwargs: dict | None = None,
+        **kwargs,
+    ):  # skipcq PYL-W0613
+        """
+        Load the content of local CSV files to an existing Sqlite table, similarly to the sqlite3
+        ``.import`` command: the rows are read with ``csv.reader`` and inserted with ``executemany`` in a
+        single transaction, without building a dataframe. Empty values are loaded as NULL, other values are
+        stored as written in the file.
+
+        :param source_file: File from which we need to transfer data
+        :param target_table: Table to which the content of the file will be loaded to
+        :param if_exists: Strategy used to load (currently supported: "append" or "replace")
+        :param native_support_kwargs: kwargs to be used by native loading command
+        """
+        input_files = resolve_file_path_pattern(source_file.path, source_file.conn_id, filetype=FileType.CSV)
+        table_name = self.get_table_qualified_name(target_table)
+        preparer = self.sqlalchemy_engine.dialect.identifier_preparer
+        connection = self.sqlalchemy_engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            for input_file in input_files:
+                with open(input_file.path, newline="", encoding="utf-8-sig") as csv_file:
+                    reader = csv.reader(csv_file)
+                    header = next(reader, None)
+                    if not header:
+                        raise DatabaseCustomError(f"The file {input_file.path} has no header")
+                    columns = ",".join(preparer.quote_identifier(column) for column in header)
+                    placeholders = ",".join("?" * len(header))
+                    cursor.executemany(
+                        f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})",
+                        (tuple(value or None for value in row) for row in reader),
+                    )
+            connection.commit()
+        except self.NATIVE_LOAD_EXCEPTIONS:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
 
     def merge_table(
         self,
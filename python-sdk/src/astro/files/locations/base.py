@@ -3,6 +3,7 @@ from __future__ import annotations
 import glob
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -14,6 +15,17 @@ from astro.exceptions import DatabaseCustomError
 from astro.options import LoadOptions
 
 
+@lru_cache(maxsize=128)
+def get_conn_type(conn_id: str) -> str:
+    """
+    Return the type of the given Airflow connection.
+    The lookup is cached since every file location built for the same connection validates it.
+
+    :param conn_id: Airflow connection ID
+    """
+    return BaseHook.get_connection(conn_id).conn_type
+
+
 class BaseFileLocation(ABC):
     """Base Location abstract class"""
 
@@ -37,7 +49,7 @@ class BaseFileLocation(ABC):
         if not self.conn_id:
             return
 
-        connection_type = BaseHook.get_connection(self.conn_id).conn_type
+        connection_type = get_conn_type(self.conn_id)
         if connection_type not in self.supported_conn_type:
             raise ValueError(
                 f"Connection type {connection_type} is not supported for {self.path}. "
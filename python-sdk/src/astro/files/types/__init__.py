@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import pathlib
+from functools import lru_cache
 
 from astro.constants import FileType as FileTypeConstants
 from astro.files.types.base import FileType
@@ -14,6 +16,17 @@ from astro.files.types.xlsx import XLSXFileType
 from astro.options import LoadOptionsList
 
 
+FILETYPE_TO_CLASS: dict[FileTypeConstants, type[FileType]] = {
+    FileTypeConstants.CSV: CSVFileType,
+    FileTypeConstants.JSON: JSONFileType,
+    FileTypeConstants.NDJSON: NDJSONFileType,
+    FileTypeConstants.PARQUET: ParquetFileType,
+    FileTypeConstants.XLS: XLSFileType,
+    FileTypeConstants.XLSX: XLSXFileType,
+}
+SUPPORTED_FILE_TYPES_TEXT = ", ".join(str(filetype) for filetype in FileTypeConstants)
+
+
 def create_file_type(
     path: str,
     filetype: FileTypeConstants | None = None,
@@ -21,50 +34,47 @@ def create_file_type(
     load_options_list: LoadOptionsList | None = None,
 ) -> FileType:
     """Factory method to create FileType super objects based on the file extension in path or filetype specified."""
-    filetype_to_class: dict[FileTypeConstants, type[FileType]] = {
-        FileTypeConstants.CSV: CSVFileType,
-        FileTypeConstants.JSON: JSONFileType,
-        FileTypeConstants.NDJSON: NDJSONFileType,
-        FileTypeConstants.PARQUET: ParquetFileType,
-        FileTypeConstants.XLS: XLSFileType,
-        FileTypeConstants.XLSX: XLSXFileType,
-    }
     if not filetype:
         filetype = get_filetype(path)
 
-    try:
-        load_options = None
-        if load_options_list is not None:
-            load_options = load_options_list.get(filetype_to_class[filetype])
-
-        return filetype_to_class[filetype](
-            path=path,
-            normalize_config=normalize_config,
-            load_options=load_options,
-        )
-    except KeyError:
+    filetype_class = FILETYPE_TO_CLASS.get(filetype)
+    if filetype_class is None:
         raise ValueError(
-            f"Non supported file type provided {filetype}, file_type should be among {', '.join(FileTypeConstants)}."
+            f"Non supported file type provided {filetype}, file_type should be among {SUPPORTED_FILE_TYPES_TEXT}."
         )
 
+    load_options = None
+    if load_options_list is not None:
+        load_options = load_options_list.get(filetype_class)
+
+    return filetype_class(
+        path=path,
+        normalize_config=normalize_config,
+        load_options=load_options,
+    )
 
-def get_filetype(filepath: str | pathlib.PosixPath) -> FileTypeConstants:
+
+def get_filetype(filepath: str | pathlib.PurePath) -> FileTypeConstants:
     """
     Return a FileType given the filepath. Uses a naive strategy, using the file extension.
 
     :param filepath: URI or Path to a file
-    :type filepath: str or pathlib.PosixPath
+    :type filepath: str or pathlib.PurePath
     :return: The filetype (e.g. csv, ndjson, json, parquet, excel)
     :rtype: astro.constants.FileType
     """
-    if isinstance(filepath, pathlib.PosixPath):
-        extension = filepath.suffix[1:]
-    else:
-        extension = ""
-        tokenized_path = filepath.split(".")
-        if len(tokenized_path) > 1:
-            extension = tokenized_path[-1]
+    path_str = filepath.as_posix() if isinstance(filepath, pathlib.PurePath) else filepath
+    return _get_filetype_from_path(path_str)
+
 
+@lru_cache(maxsize=1024)
+def _get_filetype_from_path(filepath: str) -> FileTypeConstants:
+    """
+    Return a FileType given the string filepath, memoized since the same paths are classified repeatedly.
+
+    :param filepath: URI or path to a file
+    """
+    extension = os.path.splitext(filepath)[1][1:]
     if extension == "":
         raise ValueError(
             f"Missing file extension, cannot automatically determine filetype from path '{filepath}'."
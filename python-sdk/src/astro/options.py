@@ -106,6 +106,23 @@ class SnowflakeLoadOptions(LoadOptions):
         return not self.file_options and not self.copy_options
 
 
+@attr.define
+class SqliteLoadOptions(LoadOptions):
+    """
+    Load options to load file to Sqlite.
+
+    :param use_native_csv_load: Defaults to `use_native_csv_load=False`. When enabled, local CSV files
+        are inserted with the ``csv`` module instead of being read with pandas. Values are stored as written
+        in the file, except empty values which are loaded as NULL: unlike pandas, markers such as ``NA`` or
+        ``null`` and booleans such as ``True`` are not converted.
+    """
+
+    use_native_csv_load: bool = attr.field(default=False)
+
+    def empty(self):
+        return not self.use_native_csv_load
+
+
 @attr.define
 class WASBLocationLoadOptions(LoadOptions):
     storage_account: str = attr.field(default=None)
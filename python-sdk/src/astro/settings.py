@@ -23,6 +23,14 @@ BIGQUERY_SCHEMA_LOCATION = conf.get(
     SECTION_KEY, "bigquery_dataset_location", fallback=DEFAULT_BIGQUERY_SCHEMA_LOCATION
 )
 
+#: How many S3 to Bigquery data transfers can run concurrently when loading a prefix containing multiple files
+BIGQUERY_MAX_PARALLEL_S3_TRANSFERS = conf.getint(
+    SECTION_KEY, "bigquery_max_parallel_s3_transfers", fallback=4
+)
+
+#: How many jobs loading dataframes into the same Bigquery table can run concurrently
+BIGQUERY_MAX_CONCURRENT_LOAD_JOBS = conf.getint(SECTION_KEY, "bigquery_max_concurrent_load_jobs", fallback=4)
+
 LOAD_FILE_ENABLE_NATIVE_FALLBACK = conf.get(SECTION_KEY, "load_file_enable_native_fallback", fallback=False)
 
 DATAFRAME_STORAGE_CONN_ID = conf.get(SECTION_KEY, "xcom_storage_conn_id", fallback=None)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, Callable, Sequence, cast
+from typing import Any, Callable, Sequence
 
 import jinja2
 import pandas as pd
@@ -19,7 +19,12 @@ from astro.sql.operators.upstream_task_mixin import UpstreamTaskMixin
 from astro.table import BaseTable, Table
 from astro.utils.compat.functools import cached_property
 from astro.utils.compat.typing import Context
-from astro.utils.table import find_first_table
+from astro.utils.table import find_first_table, get_callable_parameters
+
+
+# Line breaks (and stray carriage returns) of SQL files are turned into spaces in a single pass
+SQL_FILE_LINE_BREAKS_TO_SPACES = str.maketrans({"\n": " ", "\r": " "})
+JINJA_DELIMITERS = ("{{", "{%", "{#")
 
 
 class BaseSQLDecoratedOperator(UpstreamTaskMixin, DecoratedOperator):
@@ -214,9 +219,9 @@ class BaseSQLDecoratedOperator(UpstreamTaskMixin, DecoratedOperator):
             else:
                 self.sql = returned_value
                 self.parameters = self.parameters or {}
-        if self.sql.endswith(".sql"):
+        if isinstance(self.sql, str) and self.sql.endswith(".sql"):
             with open(self.sql) as file:
-                self.sql = file.read().replace("\n", " ")
+                self.sql = file.read().translate(SQL_FILE_LINE_BREAKS_TO_SPACES)
         self.op_kwargs.pop("sql", None)
 
     def move_function_params_into_sql_params(self, context: dict) -> None:
@@ -229,14 +234,34 @@ class BaseSQLDecoratedOperator(UpstreamTaskMixin, DecoratedOperator):
         if self.op_kwargs:
             self.parameters.update(self.op_kwargs)  # type: ignore
         if self.op_args:
-            params = list(inspect.signature(self.python_callable).parameters.keys())
+            params = list(get_callable_parameters(self.python_callable))
             for i, arg in enumerate(self.op_args):
                 self.parameters[params[i]] = arg  # type: ignore
         if context:
+            # Airflow builds a new Jinja environment on every render_template call unless one is given,
+            # so we share a single environment across all the parameters.
+            jinja_env = self.get_template_env()
             self.parameters = {
-                k: self.render_template(v, context) for k, v in self.parameters.items()  # type: ignore
+                k: self.render_template(v, context, jinja_env=jinja_env) if self._is_templated(v) else v
+                for k, v in self.parameters.items()  # type: ignore
             }
 
+    def _is_templated(self, value: Any) -> bool:
+        """
+        Tell whether a parameter value may need to be rendered by Jinja.
+
+        Strings without any Jinja delimiter which are not template files, numbers and None are returned
+        as they are by ``render_template``, so we skip compiling them. Other objects (e.g. tables) may have
+        templated fields of their own.
+
+        :param value: Value of a parameter
+        """
+        if isinstance(value, str):
+            return any(delimiter in value for delimiter in JINJA_DELIMITERS) or value.endswith(
+                tuple(self.template_ext)
+            )
+        return value is not None and not isinstance(value, (int, float))
+
     def translate_jinja_to_sqlalchemy_template(self, context: dict) -> None:
         """
         This function handles all jinja templating to ensure that the SQL statement is ready for
@@ -375,19 +400,8 @@ class BaseSQLDecoratedOperator(UpstreamTaskMixin, DecoratedOperator):
         :param output_table: Similar table where the dataframe content will be written to
         :return: New op_args, in which dataframes are replaced by tables
         """
-        final_args: list[Table | BaseTable] = []
         database = self.database_impl or create_database(conn_id=conn_id)
-        for arg in op_args:
-            if isinstance(arg, pd.DataFrame):
-                target_table = output_table.create_similar_table()
-                database.load_pandas_dataframe_to_table(source_dataframe=arg, target_table=target_table)
-                final_args.append(target_table)
-            elif isinstance(arg, BaseTable):
-                arg = database.populate_table_metadata(arg)
-                final_args.append(arg)
-            else:
-                final_args.append(arg)
-        return tuple(final_args)
+        return tuple(self._load_dataframe_into_sql(database, arg, output_table) for arg in op_args)
 
     def load_op_kwarg_dataframes_into_sql(
         self, conn_id: str, op_kwargs: dict, output_table: BaseTable
@@ -400,18 +414,28 @@ class BaseSQLDecoratedOperator(UpstreamTaskMixin, DecoratedOperator):
         :param output_table: Similar table where the dataframe content will be written to
         :return: New op_kwargs, in which dataframes are replaced by tables
         """
-        final_kwargs = {}
         database = self.database_impl or create_database(conn_id=conn_id)
         database.table = output_table
-        for key, value in op_kwargs.items():
-            if isinstance(value, pd.DataFrame):
-                target_table = output_table.create_similar_table()
-                df_table = cast(BaseTable, target_table.create_similar_table())
-                database.load_pandas_dataframe_to_table(source_dataframe=value, target_table=df_table)
-                final_kwargs[key] = df_table
-            elif isinstance(value, BaseTable):
-                value = database.populate_table_metadata(value)
-                final_kwargs[key] = value
-            else:
-                final_kwargs[key] = value
-        return final_kwargs
+        return {
+            key: self._load_dataframe_into_sql(database, value, output_table)
+            for key, value in op_kwargs.items()
+        }
+
+    @staticmethod
+    def _load_dataframe_into_sql(database: BaseDatabase, value: Any, output_table: BaseTable) -> Any:
+        """
+        Load a dataframe argument into a new table similar to the output table, and fill in the metadata of
+        table arguments. Other arguments are returned as they are.
+
+        :param database: Database used to load content to the table
+        :param value: user-defined decorator's arg or kwarg value
+        :param output_table: Similar table where the dataframe content will be written to
+        :return: The table the dataframe was loaded into, the populated table or the original value
+        """
+        if isinstance(value, pd.DataFrame):
+            target_table = output_table.create_similar_table()
+            database.load_pandas_dataframe_to_table(source_dataframe=value, target_table=target_table)
+            return target_table
+        if isinstance(value, BaseTable):
+            return database.populate_table_metadata(value)
+        return value
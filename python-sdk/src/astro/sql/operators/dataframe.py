@@ -23,7 +23,7 @@ from astro.sql.operators.base_operator import AstroSQLBaseOperator
 from astro.sql.table import BaseTable, Table
 from astro.utils.compat.typing import Context
 from astro.utils.dataframe import convert_columns_names_capitalization
-from astro.utils.table import find_first_table
+from astro.utils.table import find_first_table, get_callable_parameters
 
 
 def _get_dataframe(
@@ -49,20 +49,17 @@ def load_op_arg_table_into_dataframe(
     """For dataframe based functions, takes any Table objects from the op_args
     and converts them into local dataframes that can be handled in the python context"""
     full_spec = inspect.getfullargspec(python_callable)
-    op_args_list = list(op_args)
     ret_args = []
     # We check if the type annotation is of type dataframe to determine that the user actually WANTS
     # this table to be converted into a dataframe, rather that passed in as a table
     log.debug("retrieving op_args")
 
-    for arg in op_args_list:
-        current_arg = full_spec.args.pop(0)
-        if full_spec.annotations.get(current_arg) == pd.DataFrame and isinstance(arg, BaseTable):
+    for index, arg in enumerate(op_args):
+        annotation = full_spec.annotations.get(full_spec.args[index])
+        if annotation == pd.DataFrame and isinstance(arg, BaseTable):
             log.debug("Found SQL table, retrieving dataframe from table %s", arg.name)
             ret_args.append(_get_dataframe(arg, columns_names_capitalization=columns_names_capitalization))
-        elif isinstance(arg, File) and (
-            full_spec.annotations.get(current_arg) == pd.DataFrame or arg.is_dataframe
-        ):
+        elif isinstance(arg, File) and (annotation == pd.DataFrame or arg.is_dataframe):
             log.debug("Found dataframe file, retrieving dataframe from file %s", arg.path)
             ret_args.append(arg.export_to_dataframe())
         else:
@@ -78,7 +75,7 @@ def load_op_kwarg_table_into_dataframe(
 ) -> dict:
     """For dataframe based functions, takes any Table objects from the op_kwargs
     and converts them into local dataframes that can be handled in the python context"""
-    param_types = inspect.signature(python_callable).parameters
+    param_types = get_callable_parameters(python_callable)
     # We check if the type annotation is of type dataframe to determine that the user actually WANTS
     # this table to be converted into a dataframe, rather that passed in as a table
     out_dict = {}
@@ -25,6 +25,9 @@ class MergeOperator(AstroSQLBaseOperator):
         Examples: ``["sell", "list"]`` or ``{"s_sell": "t_sell", "s_list": "t_list"}``
     :param target_conflict_columns: List of cols where we expect to have a conflict while combining
     :param if_conflicts: The strategy to be applied if there are conflicts.
+    :param use_key_range_predicates: Restrict the merge condition to the range of values of each conflict
+        column in the source table, so the database can skip the parts of the target table which cannot match.
+        Only used by databases which support it (Snowflake and BigQuery).
     """
 
     template_fields = ("target_table", "source_table")
@@ -37,6 +40,7 @@ class MergeOperator(AstroSQLBaseOperator):
         columns: list[str] | tuple[str] | dict[str, str],
         if_conflicts: MergeConflictStrategy,
         target_conflict_columns: list[str],
+        use_key_range_predicates: bool = False,
         task_id: str = "",
         **kwargs: Any,
     ):
@@ -51,6 +55,7 @@ class MergeOperator(AstroSQLBaseOperator):
             )
         self.columns = columns or {}
         self.if_conflicts = if_conflicts
+        self.use_key_range_predicates = use_key_range_predicates
         task_id = task_id or get_unique_task_id("merge")
         super().__init__(
             task_id=task_id,
@@ -69,12 +74,22 @@ class MergeOperator(AstroSQLBaseOperator):
         self.source_table = db.populate_table_metadata(self.source_table)
         self.target_table = db.populate_table_metadata(self.target_table)
 
+        merge_kwargs = {}
+        if self.use_key_range_predicates:
+            if db.SUPPORTS_MERGE_KEY_RANGE_PREDICATES:
+                merge_kwargs["use_key_range_predicates"] = True
+            else:
+                self.log.warning(
+                    "Merge key range predicates are not supported by %s, ignoring them", db.sql_type
+                )
+
         db.merge_table(
             source_table=self.source_table,
             target_table=self.target_table,
             if_conflicts=self.if_conflicts,
             target_conflict_columns=self.target_conflict_columns,
             source_to_target_columns_map=self.columns,
+            **merge_kwargs,
         )
 
         # TODO: remove pushing to XCom once we update the airflow version.
@@ -174,6 +189,7 @@ def merge(
     columns: list[str] | tuple[str] | dict[str, str],
     target_conflict_columns: list[str],
     if_conflicts: MergeConflictStrategy,
+    use_key_range_predicates: bool = False,
     **kwargs: Any,
 ) -> XComArg:
     """
@@ -187,6 +203,9 @@ def merge(
         Examples: ``["sell", "list"]`` or ``{"s_sell": "t_sell", "s_list": "t_list"}``
     :param target_conflict_columns: List of cols where we expect to have a conflict while combining
     :param if_conflicts: The strategy to be applied if there are conflicts.
+    :param use_key_range_predicates: Restrict the merge condition to the range of values of each conflict
+        column in the source table, so the database can skip the parts of the target table which cannot match.
+        Only used by databases which support it (Snowflake and BigQuery).
     :param kwargs: Any keyword arguments supported by the BaseOperator is supported (e.g ``queue``, ``owner``)
     """
 
@@ -196,5 +215,6 @@ def merge(
         columns=columns,
         target_conflict_columns=target_conflict_columns,
         if_conflicts=if_conflicts,
+        use_key_range_predicates=use_key_range_predicates,
         **kwargs,
     ).output
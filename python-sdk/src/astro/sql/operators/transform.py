@@ -57,8 +57,7 @@ class TransformOperator(BaseSQLDecoratedOperator):
         self.database_impl.create_schema_if_applicable(
             self.output_table.metadata.schema, self.assume_schema_exists
         )
-        self.database_impl.drop_table(self.output_table)
-        self.database_impl.create_table_from_select_statement(
+        self.database_impl.create_or_replace_table_from_select_statement(
             statement=self.sql,
             target_table=self.output_table,
             parameters=self.parameters,
@@ -85,8 +85,10 @@ class BaseTable:
         prefix_length = len(prefix)
 
         unique_id = random.choice(string.ascii_lowercase) + "".join(
-            random.choice(string.ascii_lowercase + string.digits)
-            for _ in range(MAX_TABLE_NAME_LENGTH - schema_length - prefix_length)
+            random.choices(
+                string.ascii_lowercase + string.digits,
+                k=MAX_TABLE_NAME_LENGTH - schema_length - prefix_length,
+            )
         )
         if prefix:
             unique_id = f"{prefix}{unique_id}"
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Iterable, Mapping
 
 from airflow.models.xcom_arg import XComArg
 
@@ -9,6 +10,18 @@ from astro.sql.table import BaseTable
 from astro.utils.compat.typing import Context
 
 
+@lru_cache(maxsize=256)
+def get_callable_parameters(python_callable: Callable) -> Mapping[str, inspect.Parameter]:
+    """
+    Return the parameters of the signature of a user-defined callable, by name.
+    The signature is introspected once per callable, since it is needed every time the operator is executed.
+
+    :param python_callable: user-defined operator's callable
+    :return: read-only mapping of parameter names to parameters, in declaration order
+    """
+    return inspect.signature(python_callable).parameters
+
+
 def _have_same_conn_id(tables: list[BaseTable]) -> bool:
     """
     Check to see if all tables belong to same conn_id. Otherwise, this can go wrong for cases
@@ -21,6 +34,23 @@ def _have_same_conn_id(tables: list[BaseTable]) -> bool:
     return len(tables) == 1 or len({table.conn_id for table in tables}) == 1
 
 
+def _resolve_tables(values: Iterable, context: Context) -> list[BaseTable]:
+    """
+    Resolve the XComArgs among the given values and keep the tables, in a single pass.
+
+    :param values: user-defined operator's args, kwargs or parameters values
+    :param context: the context to use for resolving XComArgs
+    :return: the tables found, in the order they were given
+    """
+    tables = []
+    for value in values:
+        if isinstance(value, XComArg):
+            value = value.resolve(context)
+        if isinstance(value, BaseTable):
+            tables.append(value)
+    return tables
+
+
 def _find_first_table_from_op_args(op_args: tuple, context: Context) -> BaseTable | None:
     """
     Read op_args and extract the tables.
@@ -29,8 +59,7 @@ def _find_first_table_from_op_args(op_args: tuple, context: Context) -> BaseTabl
     :param context: the context to use for resolving XComArgs
     :return: first valid table found in op_args.
     """
-    args = [arg.resolve(context) if isinstance(arg, XComArg) else arg for arg in op_args]
-    tables = [arg for arg in args if isinstance(arg, BaseTable)]
+    tables = _resolve_tables(op_args, context)
 
     if _have_same_conn_id(tables):
         return tables[0]
@@ -47,15 +76,7 @@ def _find_first_table_from_op_kwargs(
     :param context: the context to use for resolving XComArgs
     :return: first valid table found in op_kwargs.
     """
-    kwargs = [
-        (
-            op_kwargs[kwarg.name].resolve(context)
-            if isinstance(op_kwargs[kwarg.name], XComArg)
-            else op_kwargs[kwarg.name]
-        )
-        for kwarg in inspect.signature(python_callable).parameters.values()
-    ]
-    tables = [kwarg for kwarg in kwargs if isinstance(kwarg, BaseTable)]
+    tables = _resolve_tables((op_kwargs[name] for name in get_callable_parameters(python_callable)), context)
 
     if _have_same_conn_id(tables):
         return tables[0]
@@ -70,10 +91,7 @@ def _find_first_table_from_parameters(parameters: dict, context: Context) -> Bas
     :param context: the context to use for resolving XComArgs
     :return: first valid table found in parameters.
     """
-    params = [
-        param.resolve(context) if isinstance(param, XComArg) else param for param in parameters.values()
-    ]
-    tables = [param for param in params if isinstance(param, BaseTable)]
+    tables = _resolve_tables(parameters.values(), context)
 
     if _have_same_conn_id(tables):
         return tables[0]
@@ -5,9 +5,9 @@ import pytest
 from airflow.models.connection import Connection
 from pandas import DataFrame
 
-from astro.constants import FileType
+from astro.constants import FileLocation, FileType
 from astro.databases import create_database
-from astro.databases.base import BaseDatabase
+from astro.databases.base import BaseDatabase, get_autocommit_text_clause
 from astro.files import File
 from astro.table import BaseTable, Table
 
@@ -132,3 +132,116 @@ def test_database_for_s3_conn_with_check_for_minio_connection(get_connection, va
         )
         is False
     )
+
+
+def test_native_path_handlers_are_bound_methods():
+    """Test NATIVE_PATHS method names are resolved to the instance methods, including overridden ones."""
+
+    class NativeDatabase(DatabaseSubclass):
+        NATIVE_PATHS = {FileLocation.S3: "load_s3_file_to_table"}
+
+        def load_s3_file_to_table(self, **kwargs):
+            return kwargs
+
+    db = NativeDatabase(conn_id="fake_conn_id")
+    handler = db.native_path_handlers[FileLocation.S3]
+    assert handler.__self__ is db
+    assert handler(source_file="s3://bucket/key.csv") == {"source_file": "s3://bucket/key.csv"}
+    assert DatabaseSubclass(conn_id="fake_conn_id").native_path_handlers == {}
+
+
+def test_run_sql_shares_connection_with_pre_and_post_queries():
+    """Test that the query modifier statements run on the same connection as the main statement"""
+    from astro.query_modifier import QueryModifier
+
+    db = DatabaseSubclass(conn_id="fake_conn_id")
+    with mock.patch.object(DatabaseSubclass, "connection", new_callable=mock.PropertyMock) as connection:
+        db.run_sql(
+            "SELECT 1",
+            query_modifier=QueryModifier(pre_queries=["ALTER team_1"], post_queries=["ALTER team_2"]),
+        )
+    connection.assert_called_once()
+    assert connection.return_value.execute.call_count == 3
+
+
+@mock.patch.object(DatabaseSubclass, "create_table_from_select_statement")
+@mock.patch.object(DatabaseSubclass, "drop_table")
+def test_create_or_replace_table_from_select_statement_drops_table_first(
+    mock_drop_table, mock_create_table_from_select_statement
+):
+    """Test that databases without a single replace statement drop the table before creating it"""
+    db = DatabaseSubclass(conn_id="fake_conn_id")
+    table = Table(name="my_table")
+
+    db.create_or_replace_table_from_select_statement(statement="SELECT 1", target_table=table)
+
+    mock_drop_table.assert_called_once_with(table)
+    mock_create_table_from_select_statement.assert_called_once()
+
+
+def test_get_autocommit_text_clause_is_cached():
+    """Test that the text clause of a statement is built once and runs with autocommit"""
+    text_clause = get_autocommit_text_clause("SELECT 1")
+
+    assert get_autocommit_text_clause("SELECT 1") is text_clause
+    assert text_clause.text == "SELECT 1"
+    assert text_clause.get_execution_options()["autocommit"] is True
+
+
+@mock.patch.object(DatabaseSubclass, "run_sql")
+@mock.patch.object(DatabaseSubclass, "schema_exists", return_value=False)
+def test_create_schema_if_applicable_checks_each_schema_once(mock_schema_exists, mock_run_sql):
+    """Test that a schema already checked or created by the database instance is not looked up again"""
+    db = DatabaseSubclass(conn_id="fake_conn_id")
+
+    db.create_schema_if_applicable("my_schema", assume_exists=False)
+    db.create_schema_if_applicable("my_schema", assume_exists=False)
+
+    mock_schema_exists.assert_called_once_with("my_schema")
+    mock_run_sql.assert_called_once_with("CREATE SCHEMA IF NOT EXISTS my_schema")
+
+
+@pytest.mark.parametrize(
+    "max_bind_parameters,chunk_size,expected_chunk_size",
+    [(None, 1000, 1000), (999, 1000, 333), (999, 100, 100), (2, 1000, 1)],
+)
+def test_get_multi_row_insert_chunk_size(max_bind_parameters, chunk_size, expected_chunk_size):
+    """Test that multi-row inserts bind at most the number of parameters supported by the database"""
+    db = DatabaseSubclass(conn_id="fake_conn_id")
+    db.MAX_BIND_PARAMETERS = max_bind_parameters
+    dataframe = DataFrame({"a": [1], "b": [2], "c": [3]})
+
+    assert db.get_multi_row_insert_chunk_size(dataframe, chunk_size) == expected_chunk_size
+
+
+def test_get_multi_row_insert_chunk_size_within_statement_size():
+    """Test that multi-row inserts of wide rows are kept within half of the maximum statement size"""
+    db = DatabaseSubclass(conn_id="fake_conn_id")
+    db.MAX_STATEMENT_BYTES = 1024 * 1024
+    dataframe = DataFrame({"a": ["x" * 1000] * 10000})
+
+    chunk_size = db.get_multi_row_insert_chunk_size(dataframe, 10000)
+
+    assert 0 < chunk_size < 10000
+    assert chunk_size * 1000 <= db.MAX_STATEMENT_BYTES / 2
+
+
+@pytest.mark.parametrize(
+    "row,expected_key_ranges",
+    [
+        ((20000, 1, 10, "a", "z"), [(1, 10), ("a", "z")]),
+        ((9999, 1, 10, "a", "z"), []),
+        ((20000, None, None, "a", "z"), []),
+    ],
+    ids=["large_source", "small_source", "null_key"],
+)
+@mock.patch("astro.databases.base.BaseDatabase.run_sql")
+def test_get_merge_key_ranges(mock_run_sql, row, expected_key_ranges):
+    """Test that the merge key ranges are looked up in one query and skipped when they would not pay off"""
+    mock_run_sql.return_value = row
+    db = DatabaseSubclass(conn_id="fake_conn_id")
+
+    assert db.get_merge_key_ranges(Table(name="source_table"), ["id", "name"]) == expected_key_ranges
+    assert mock_run_sql.call_args.args[0] == (
+        "SELECT COUNT(*), MIN(id), MAX(id), MIN(name), MAX(name) FROM source_table"
+    )
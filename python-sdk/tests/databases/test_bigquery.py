@@ -1,6 +1,9 @@
 import pathlib
+import time
 from unittest import mock
 
+import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from google.cloud.bigquery_datatransfer_v1.types import (
     StartManualTransferRunsResponse,
@@ -9,7 +12,14 @@ from google.cloud.bigquery_datatransfer_v1.types import (
 )
 
 from astro import settings
-from astro.databases.google.bigquery import BigqueryDatabase, S3ToBigqueryDataTransfer
+from astro.constants import FileType
+from astro.databases.google.bigquery import (
+    S3_CREDENTIALS_CACHE_TTL_SECONDS,
+    BigqueryDatabase,
+    S3ToBigqueryDataTransfer,
+    _get_s3_credentials,
+    get_s3_credentials,
+)
 from astro.exceptions import DatabaseCustomError
 from astro.files import File
 from astro.table import TEMP_PREFIX, Metadata, Table
@@ -158,3 +168,209 @@ def test_get_project_id_raise_exception(mock_hook):
 
     with pytest.raises(DatabaseCustomError):
         database.get_project_id(target_table=Table())
+
+
+@mock.patch("astro.databases.google.bigquery.BiqQueryDataTransferServiceHook")
+def test_run_transfer_now_does_not_schedule_in_the_future(mock_dts_hook):
+    """Test the manual transfer run is requested for the current time, not a few seconds ahead."""
+    transfer = S3ToBigqueryDataTransfer.__new__(S3ToBigqueryDataTransfer)
+    transfer.client = mock_dts_hook.return_value
+    transfer.project_id = "test_project_id"
+    response = StartManualTransferRunsResponse()
+    response.runs.append(TransferRun(name="projects/1/locations/us/transferConfigs/config-id/runs/run-id"))
+    transfer.client.start_manual_transfer_runs.return_value = response
+
+    before = time.time()
+    assert transfer.run_transfer_now("config-id") == "run-id"
+
+    requested_run_time = transfer.client.start_manual_transfer_runs.call_args.kwargs["requested_run_time"]
+    assert requested_run_time.ToSeconds() <= int(time.time())
+    assert requested_run_time.ToSeconds() >= int(before)
+
+
+@pytest.mark.parametrize(
+    "source_file",
+    [File("gs://bucket/sample.csv"), File("gs://bucket/homes*", filetype=FileType.CSV)],
+    ids=["file", "wildcard"],
+)
+@mock.patch("astro.databases.google.bigquery.resolve_file_path_pattern")
+def test_get_gs_source_uris_keeps_files_and_wildcards(mock_resolve, source_file):
+    """Test files and wildcards are handed to BigQuery as they are."""
+    assert BigqueryDatabase.get_gs_source_uris(source_file) == [source_file.path]
+    mock_resolve.assert_not_called()
+
+
+@mock.patch("astro.databases.google.bigquery.resolve_file_path_pattern")
+def test_get_gs_source_uris_resolves_prefixes_to_files_of_the_same_type(mock_resolve):
+    """Test prefixes are resolved to their objects, skipping the objects of other file types."""
+    mock_resolve.return_value = [
+        File("gs://bucket/dir/a.csv"),
+        File("gs://bucket/dir/_SUCCESS", filetype=FileType.CSV),
+        File("gs://bucket/dir/b.json"),
+        File("gs://bucket/dir/b.csv"),
+    ]
+    source_file = File("gs://bucket/dir/", filetype=FileType.CSV)
+
+    source_uris = BigqueryDatabase.get_gs_source_uris(source_file)
+
+    assert source_uris == ["gs://bucket/dir/a.csv", "gs://bucket/dir/b.csv"]
+    mock_resolve.assert_called_once_with("gs://bucket/dir/", None, filetype=FileType.CSV, load_options=[])
+
+
+@mock.patch("astro.databases.google.bigquery.BIGQUERY_MAX_SOURCE_URIS_PER_LOAD_JOB", 2)
+@mock.patch("astro.databases.google.bigquery.resolve_file_path_pattern")
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.hook")
+def test_load_gs_file_to_table_batches_source_uris(mock_hook, mock_resolve):
+    """Test the objects of a prefix are loaded by one job per batch of URIs, truncating the table once."""
+    mock_hook.project_id = "test_project_id"
+    mock_resolve.return_value = [File(f"gs://bucket/dir/sample_{index}.csv") for index in range(3)]
+    database = BigqueryDatabase()
+    table = Table(name="test_table", metadata=Metadata(schema="test_schema"))
+    source_file = File("gs://bucket/dir/", filetype=FileType.CSV)
+
+    database.load_gs_file_to_table(source_file=source_file, target_table=table, if_exists="replace")
+
+    load_configs = [call.kwargs["configuration"]["load"] for call in mock_hook.insert_job.call_args_list]
+    assert [config["sourceUris"] for config in load_configs] == [
+        ["gs://bucket/dir/sample_0.csv", "gs://bucket/dir/sample_1.csv"],
+        ["gs://bucket/dir/sample_2.csv"],
+    ]
+    assert [config["writeDisposition"] for config in load_configs] == ["WRITE_TRUNCATE", "WRITE_APPEND"]
+
+
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.hook")
+def test_load_gs_file_to_table_source_uris_can_be_overridden(mock_hook):
+    """Test the source URIs passed as kwargs take precedence over the ones built from the file."""
+    mock_hook.project_id = "test_project_id"
+    database = BigqueryDatabase()
+    table = Table(name="test_table", metadata=Metadata(schema="test_schema"))
+
+    database.load_gs_file_to_table(
+        source_file=File("gs://bucket/sample.csv"), target_table=table, sourceUris=["gs://other/sample.csv"]
+    )
+
+    load_config = mock_hook.insert_job.call_args.kwargs["configuration"]["load"]
+    assert load_config["sourceUris"] == ["gs://other/sample.csv"]
+
+
+@mock.patch("astro.databases.google.bigquery.BiqQueryDataTransferServiceHook")
+@mock.patch("astro.databases.google.bigquery.S3ToBigqueryDataTransfer")
+@mock.patch("astro.databases.google.bigquery.resolve_file_path_pattern")
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.hook")
+def test_load_s3_file_to_table_runs_one_transfer_per_file_of_a_prefix(
+    mock_hook, mock_resolve, mock_transfer, mock_dts_hook
+):
+    """Test a S3 prefix is split in one data transfer per file."""
+    mock_hook.project_id = "test_project_id"
+    mock_resolve.return_value = [File("s3://bucket/dir/a.csv"), File("s3://bucket/dir/b.csv")]
+    database = BigqueryDatabase()
+    table = Table(name="test_table", metadata=Metadata(schema="test_schema"))
+
+    database.load_s3_file_to_table(
+        source_file=File("s3://bucket/dir/", filetype=FileType.CSV), target_table=table
+    )
+
+    transferred_paths = {call.kwargs["source_file"].path for call in mock_transfer.call_args_list}
+    assert transferred_paths == {"s3://bucket/dir/a.csv", "s3://bucket/dir/b.csv"}
+    assert mock_transfer.return_value.run.call_count == 2
+    # The transfers share a single client, created before they run concurrently
+    mock_dts_hook.assert_called_once_with(gcp_conn_id=table.conn_id)
+    mock_dts_hook.return_value.get_conn.assert_called_once_with()
+    assert {call.kwargs["client"] for call in mock_transfer.call_args_list} == {mock_dts_hook.return_value}
+
+
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.hook")
+def test_load_pandas_dataframe_to_table_in_chunks(mock_hook):
+    """Test each chunk of the dataframe is uploaded as Parquet, only the first one replacing the table."""
+    database = BigqueryDatabase()
+    table = Table(name="test_table", metadata=Metadata(schema="test_schema"))
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["First", "Second", "Third"]})
+
+    database.load_pandas_dataframe_to_table(df, table, if_exists="replace", chunk_size=2)
+
+    load_calls = mock_hook.get_client.return_value.load_table_from_file.call_args_list
+    assert [pq.read_table(call.args[0]).num_rows for call in load_calls] == [2, 1]
+    assert {call.kwargs["job_config"].source_format for call in load_calls} == {"PARQUET"}
+    assert [call.kwargs["job_config"].write_disposition for call in load_calls] == [
+        "WRITE_TRUNCATE",
+        "WRITE_APPEND",
+    ]
+    assert {call.kwargs["destination"] for call in load_calls} == {"test_schema.test_table"}
+
+
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.run_sql")
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.schema_exists", return_value=False)
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.hook")
+def test_load_pandas_dataframe_to_table_creates_missing_dataset(mock_hook, mock_schema_exists, mock_run_sql):
+    """Test the dataset of the table is created before loading the dataframe, as pandas-gbq used to do."""
+    database = BigqueryDatabase()
+    table = Table(name="test_table", metadata=Metadata(schema="new_schema"))
+
+    database.load_pandas_dataframe_to_table(pd.DataFrame({"id": [1]}), table)
+
+    mock_schema_exists.assert_called_once_with("new_schema")
+    assert "CREATE SCHEMA IF NOT EXISTS new_schema" in mock_run_sql.call_args.args[0]
+    mock_hook.get_client.return_value.load_table_from_file.assert_called_once()
+
+
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.hook")
+def test_load_pandas_dataframe_to_table_coerces_mixed_object_columns(mock_hook):
+    """Test object columns holding values of different types are uploaded as strings, keeping nulls."""
+    database = BigqueryDatabase()
+    table = Table(name="test_table", metadata=Metadata(schema="test_schema"))
+    df = pd.DataFrame({"id": [1, 2, 3], "mixed": [1, "two", None]})
+
+    database.load_pandas_dataframe_to_table(df, table)
+
+    load_call = mock_hook.get_client.return_value.load_table_from_file.call_args
+    uploaded = pq.read_table(load_call.args[0])
+    assert uploaded.column("mixed").to_pylist() == ["1", "two", None]
+    assert df["mixed"].tolist() == [1, "two", None]
+
+
+@mock.patch("astro.databases.google.bigquery.BIGQUERY_MAX_CONCURRENT_LOAD_JOBS", 2)
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.submit_pandas_dataframe_load")
+def test_load_pandas_dataframes_to_table_limits_running_jobs(mock_submit):
+    """Test load jobs are submitted without waiting for the previous ones, up to the concurrency limit."""
+    events = []
+
+    def submit(source_dataframe, target_table, if_exists):
+        index = len([event for event in events if event[0] == "submit"])
+        events.append(("submit", index, if_exists))
+        return mock.Mock(result=lambda: events.append(("wait", index)))
+
+    mock_submit.side_effect = submit
+    database = BigqueryDatabase()
+    dataframes = [pd.DataFrame({"id": [index]}) for index in range(4)]
+
+    database.load_pandas_dataframes_to_table(dataframes, Table(name="test_table"), if_exists="replace")
+
+    assert events == [
+        ("submit", 0, "replace"),
+        ("wait", 0),
+        ("submit", 1, "append"),
+        ("submit", 2, "append"),
+        ("wait", 1),
+        ("submit", 3, "append"),
+        ("wait", 2),
+        ("wait", 3),
+    ]
+
+
+@mock.patch("astro.databases.google.bigquery.time.monotonic")
+@mock.patch("airflow.providers.amazon.aws.hooks.s3.S3Hook")
+def test_get_s3_credentials_is_cached_per_connection(mock_s3_hook, mock_monotonic):
+    """Test the AWS credentials are only looked up once per connection until the cache entry expires."""
+    _get_s3_credentials.cache_clear()
+    mock_s3_hook.return_value.get_credentials.return_value = mock.Mock(access_key="key", secret_key="secret")
+    mock_monotonic.return_value = 0
+
+    assert get_s3_credentials("aws_conn") == ("key", "secret")
+    assert get_s3_credentials("aws_conn") == ("key", "secret")
+    mock_s3_hook.assert_called_once_with(aws_conn_id="aws_conn")
+
+    mock_s3_hook.return_value.get_credentials.return_value = mock.Mock(access_key="new", secret_key="rotated")
+    mock_monotonic.return_value = S3_CREDENTIALS_CACHE_TTL_SECONDS
+    assert get_s3_credentials("aws_conn") == ("new", "rotated")
+    assert mock_s3_hook.call_count == 2
+    _get_s3_credentials.cache_clear()
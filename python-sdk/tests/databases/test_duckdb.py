@@ -5,4 +5,4 @@ def test_get_merge_initialization_query():
     parameters = ("col_1", "col_2")
 
     sql = DuckdbDatabase.get_merge_initialization_query(parameters)
-    assert sql == "CREATE UNIQUE INDEX merge_index ON {{table}}(col_1,col_2)"
+    assert sql == "CREATE UNIQUE INDEX IF NOT EXISTS merge_index ON {{table}}(col_1,col_2)"
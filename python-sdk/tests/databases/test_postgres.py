@@ -0,0 +1,23 @@
+"""Tests specific to the Postgres Database implementation."""
+
+from unittest import mock
+
+from astro.databases.postgres import PostgresDatabase
+from astro.table import Metadata, Table
+
+
+@mock.patch("astro.databases.postgres.PostgresDatabase.run_sql")
+@mock.patch("astro.databases.postgres.PostgresDatabase.drop_table")
+def test_create_or_replace_table_from_select_statement_runs_single_request(mock_drop_table, mock_run_sql):
+    """Test that Postgres drops and creates the target table in a single request"""
+    database = PostgresDatabase(conn_id="fake-conn")
+    table = Table(name="my_table", metadata=Metadata(schema="my_schema"))
+
+    database.create_or_replace_table_from_select_statement(statement="SELECT 1", target_table=table)
+
+    mock_drop_table.assert_not_called()
+    mock_run_sql.assert_called_once()
+    expected_statement = (
+        "DROP TABLE IF EXISTS my_schema.my_table; CREATE TABLE my_schema.my_table AS SELECT 1"
+    )
+    assert mock_run_sql.call_args.kwargs["sql"] == expected_statement
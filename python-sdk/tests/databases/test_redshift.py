@@ -2,10 +2,15 @@
 
 from unittest import mock
 
+import pandas as pd
 from airflow.models import Connection
 from airflow.providers.amazon.aws.hooks.redshift_sql import RedshiftSQLHook
 
-from astro.databases.aws.redshift import RedshiftDatabase
+from astro.databases.aws.redshift import (
+    REDSHIFT_MAX_BIND_PARAMETERS,
+    REDSHIFT_MAX_STATEMENT_BYTES,
+    RedshiftDatabase,
+)
 from astro.table import Metadata, Table
 
 
@@ -19,3 +24,35 @@ def test_hook_with_db_from_table(mock_conn, redshift_conn):
     assert isinstance(hook, RedshiftSQLHook)
     # TODO: Remove comment when RedshiftSQLHook in Airflow start using the kwargs
     # redshift_conn.assert_called_once_with({"database": "dev"})
+
+
+@mock.patch("astro.databases.aws.redshift.RedshiftDatabase.connection")
+def test_load_pandas_dataframe_to_table_inserts_rows_in_batches(mock_connection):
+    """Test that dataframes are inserted with multi-row statements within the bind parameters limit"""
+    database = RedshiftDatabase(conn_id="fake-conn")
+    dataframe = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+    with mock.patch.object(pd.DataFrame, "to_sql") as mock_to_sql:
+        database.load_pandas_dataframe_to_table(
+            source_dataframe=dataframe, target_table=Table(name="my_table")
+        )
+
+    assert mock_to_sql.call_args.kwargs["method"] == "multi"
+    assert mock_to_sql.call_args.kwargs["chunksize"] == REDSHIFT_MAX_BIND_PARAMETERS // 2
+
+
+@mock.patch("astro.databases.aws.redshift.RedshiftDatabase.connection")
+def test_load_pandas_dataframe_to_table_splits_wide_rows_within_statement_size(mock_connection):
+    """Test that large dataframes of wide rows are inserted in several statements within the size limit"""
+    database = RedshiftDatabase(conn_id="fake-conn")
+    dataframe = pd.DataFrame({"id": range(20000), "description": ["x" * 2000] * 20000})
+
+    with mock.patch.object(pd.DataFrame, "to_sql") as mock_to_sql:
+        database.load_pandas_dataframe_to_table(
+            source_dataframe=dataframe, target_table=Table(name="my_table")
+        )
+
+    chunk_size = mock_to_sql.call_args.kwargs["chunksize"]
+    assert chunk_size < REDSHIFT_MAX_BIND_PARAMETERS // 2
+    assert len(dataframe) / chunk_size > 1
+    assert chunk_size * 2000 < REDSHIFT_MAX_STATEMENT_BYTES
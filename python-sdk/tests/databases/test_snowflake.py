@@ -1,11 +1,16 @@
 """Tests specific to the Snowflake Database implementation."""
 
+import datetime
+import decimal
 import pathlib
 from unittest import mock
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import pandas as pd
 import pytest
+import sqlalchemy
 
+from astro.constants import DEFAULT_CHUNK_SIZE
 from astro.databases.snowflake import SnowflakeDatabase, SnowflakeFileFormat, SnowflakeStage
 from astro.exceptions import DatabaseCustomError
 from astro.files import File
@@ -293,3 +298,193 @@ def test_get_merge_initialization_query():
     parameters = ("col_1", "col_2")
     sql = SnowflakeDatabase.get_merge_initialization_query(parameters)
     assert sql == "ALTER TABLE {{table}} ADD CONSTRAINT airflow UNIQUE (col_1,col_2)"
+
+
+@pytest.mark.parametrize(
+    "columns,expected_statement",
+    [
+        (
+            ["id", "name", "price", "sold", "created"],
+            "CREATE OR REPLACE TABLE db.schema.TABLE_NAME "
+            "(id NUMBER, name VARCHAR, price FLOAT, sold BOOLEAN, created TIMESTAMP_NTZ)",
+        ),
+        (
+            ["Id", "Name", "Price", "Sold", "Created"],
+            'CREATE OR REPLACE TABLE "db"."schema"."TABLE_NAME" '
+            '("Id" NUMBER, "Name" VARCHAR, "Price" FLOAT, "Sold" BOOLEAN, "Created" TIMESTAMP_NTZ)',
+        ),
+    ],
+    ids=["lower_case_columns", "mixed_case_columns"],
+)
+def test_get_create_or_replace_table_statement(columns, expected_statement):
+    """Test the replacing DDL uses the dataframe dtypes and the same quoting as write_pandas."""
+    dataframe = pd.DataFrame(
+        {
+            columns[0]: [1, 2],
+            columns[1]: ["First", "Second"],
+            columns[2]: [1.5, 2.5],
+            columns[3]: [True, False],
+            columns[4]: pd.to_datetime(["2022-01-01", "2022-01-02"]),
+        }
+    )
+    table = Table(name="table_name", metadata=Metadata(schema="schema", database="db"))
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    assert database.get_create_or_replace_table_statement(table, dataframe) == expected_statement
+
+
+@mock.patch("astro.databases.snowflake.pandas_tools.write_pandas")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.hook", new_callable=PropertyMock)
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.table_exists")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.run_sql")
+def test_load_pandas_dataframe_to_table_replace_skips_reflection(
+    mock_run_sql, mock_table_exists, mock_hook, mock_write_pandas
+):
+    """
+    Test replacing a table issues one DDL statement instead of checking the table and inferring its schema.
+    """
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    table = Table(name="table_name", metadata=Metadata(schema="schema", database="db"))
+
+    database.load_pandas_dataframe_to_table(pd.DataFrame({"id": [1, 2]}), table, if_exists="replace")
+
+    mock_table_exists.assert_not_called()
+    mock_run_sql.assert_called_once_with("CREATE OR REPLACE TABLE db.schema.TABLE_NAME (id NUMBER)")
+    assert mock_write_pandas.call_args.kwargs["auto_create_table"] is False
+
+
+@mock.patch("astro.databases.snowflake.pandas_tools.write_pandas")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.hook", new_callable=PropertyMock)
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.table_exists", return_value=True)
+def test_load_pandas_dataframe_to_table_uses_default_chunk_size(
+    mock_table_exists, mock_hook, mock_write_pandas
+):
+    """Test that dataframes are written to Snowflake in chunks of the default size."""
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    table = Table(name="table_name", metadata=Metadata(schema="schema", database="db"))
+
+    database.load_pandas_dataframe_to_table(pd.DataFrame({"id": [1, 2]}), table, if_exists="append")
+
+    assert mock_write_pandas.call_args.kwargs["chunk_size"] == DEFAULT_CHUNK_SIZE
+
+
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.run_sql")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.drop_table")
+def test_create_or_replace_table_from_select_statement_runs_single_statement(mock_drop_table, mock_run_sql):
+    """Test that Snowflake replaces the target table without dropping it beforehand"""
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    table = Table(name="my_table", metadata=Metadata(database="my_db", schema="my_schema"))
+
+    database.create_or_replace_table_from_select_statement(statement="SELECT 1", target_table=table)
+
+    mock_drop_table.assert_not_called()
+    expected_statement = "CREATE OR REPLACE TABLE my_db.my_schema.my_table AS SELECT 1"
+    assert mock_run_sql.call_args.kwargs["sql"] == expected_statement
+
+
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.get_merge_key_ranges", return_value=[(1, 10)])
+def test_build_merge_sql_with_key_range_predicates(mock_get_merge_key_ranges):
+    """
+    Test that the merge condition is restricted to the range of the conflict columns in the source table.
+    """
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    source_table = Table(name="source_table", metadata=Metadata(schema="schema", database="db"))
+    target_table = Table(name="target_table", metadata=Metadata(schema="schema", database="db"))
+
+    statement, params = database._build_merge_sql(
+        source_table=source_table,
+        target_table=target_table,
+        source_to_target_columns_map={"id": "id"},
+        target_conflict_columns=["id"],
+        if_conflicts="ignore",
+        use_key_range_predicates=True,
+    )
+
+    mock_get_merge_key_ranges.assert_called_once_with(source_table, ["id"])
+    assert (
+        "on Identifier(:merge_clause_target_0)=Identifier(:merge_clause_source_0)"
+        " AND Identifier(:merge_clause_target_0)>=:merge_key_min_0"
+        " AND Identifier(:merge_clause_target_0)<=:merge_key_max_0 when not matched" in statement
+    )
+    assert params["merge_key_min_0"] == 1
+    assert params["merge_key_max_0"] == 10
+
+
+def test_get_create_or_replace_table_statement_types_object_columns_by_value():
+    """Test date and decimal values held in object columns are not created as VARCHAR columns."""
+    dataframe = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "created": [datetime.date(2022, 1, 1), None],
+            "price": [decimal.Decimal("1.5"), decimal.Decimal("2.25")],
+            "name": ["First", None],
+        }
+    )
+    table = Table(name="table_name", metadata=Metadata(schema="schema", database="db"))
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    assert database.get_create_or_replace_table_statement(table, dataframe) == (
+        "CREATE OR REPLACE TABLE db.schema.TABLE_NAME "
+        "(id NUMBER, created DATE, price NUMBER(38, 2), name VARCHAR)"
+    )
+
+
+@mock.patch("astro.databases.snowflake.pandas_tools.write_pandas")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.hook", new_callable=PropertyMock)
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.run_sql")
+def test_load_pandas_dataframe_to_table_replace_adds_metadata_columns(
+    mock_run_sql, mock_hook, mock_write_pandas
+):
+    """Test replacing a table keeps the metadata columns requested in the load options."""
+    database = SnowflakeDatabase(
+        conn_id="fake-conn", load_options=SnowflakeLoadOptions(metadata_columns=["METADATA$FILENAME"])
+    )
+    table = Table(name="table_name", metadata=Metadata(schema="schema", database="db"))
+
+    database.load_pandas_dataframe_to_table(pd.DataFrame({"id": [1, 2]}), table, if_exists="replace")
+
+    mock_run_sql.assert_called_once_with("CREATE OR REPLACE TABLE db.schema.TABLE_NAME (id NUMBER)")
+    expected_sql = "ALTER TABLE db.schema.table_name ADD COLUMN IF NOT EXISTS METADATA$FILENAME VARCHAR;"
+    mock_hook.return_value.run.assert_called_once_with(expected_sql, autocommit=True)
+
+
+@mock.patch("astro.databases.snowflake.pandas_tools.write_pandas")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.hook", new_callable=PropertyMock)
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.run_sql")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.create_table_using_columns")
+@mock.patch("astro.databases.snowflake.SnowflakeDatabase.drop_table")
+def test_load_pandas_dataframe_to_table_replace_keeps_declared_columns(
+    mock_drop_table, mock_create_table_using_columns, mock_run_sql, mock_hook, mock_write_pandas
+):
+    """Test replacing a table with declared columns creates them instead of inferring them from the data."""
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    table = Table(
+        name="table_name",
+        metadata=Metadata(schema="schema", database="db"),
+        columns=[
+            sqlalchemy.Column("id", sqlalchemy.String(60), primary_key=True),
+            sqlalchemy.Column("price", sqlalchemy.Numeric(10, 2)),
+        ],
+    )
+
+    database.load_pandas_dataframe_to_table(
+        pd.DataFrame({"id": [1, 2], "price": [1.5, 2.5]}), table, if_exists="replace"
+    )
+
+    mock_run_sql.assert_not_called()
+    mock_drop_table.assert_called_once_with(table)
+    mock_create_table_using_columns.assert_called_once_with(table)
+    created_table = mock_create_table_using_columns.call_args.args[0]
+    assert isinstance(created_table.columns[0].type, sqlalchemy.String)
+    assert isinstance(created_table.columns[1].type, sqlalchemy.Numeric)
+    assert created_table.columns[1].type.scale == 2
+
+
+def test_get_create_or_replace_table_statement_warns_about_unmapped_dtypes(caplog):
+    """Test dtypes without a matching Snowflake type are created as VARCHAR with a warning."""
+    dataframe = pd.DataFrame({"duration": pd.to_timedelta([1, 2], unit="s")})
+    table = Table(name="table_name", metadata=Metadata(schema="schema", database="db"))
+    database = SnowflakeDatabase(conn_id="fake-conn")
+
+    statement = database.get_create_or_replace_table_statement(table, dataframe)
+
+    assert statement == "CREATE OR REPLACE TABLE db.schema.TABLE_NAME (duration VARCHAR)"
+    assert "Column duration of dtype timedelta64[ns] has no matching Snowflake type" in caplog.text
@@ -2,11 +2,15 @@
 
 import pathlib
 
+import pandas as pd
 import pytest
+from sqlalchemy import create_engine
 
 from astro.constants import Database
-from astro.databases.sqlite import SqliteDatabase
+from astro.databases.sqlite import SqliteDatabase, get_sqlite_engine
 from astro.files import File
+from astro.options import SqliteLoadOptions
+from astro.table import Table
 
 DEFAULT_CONN_ID = "sqlite_default"
 CUSTOM_CONN_ID = "sqlite_conn"
@@ -34,8 +38,73 @@ def test_export_table_to_file_file_already_exists_raises_exception(
     assert err_msg.endswith(f"The file {filepath} already exists.")
 
 
+def test_get_sqlite_engine_is_shared_per_database_path(tmp_path):
+    """Databases pointing to the same Sqlite file reuse a single engine."""
+    database_path = str(tmp_path / "shared.db")
+    engine = get_sqlite_engine(database_path)
+    assert get_sqlite_engine(database_path) is engine
+    assert engine.url.database == database_path
+    assert get_sqlite_engine(str(tmp_path / "other.db")) is not engine
+
+
 def test_get_merge_initialization_query():
     parameters = ("col_1 text(4)", "col_2 text(15)")
 
     sql = SqliteDatabase.get_merge_initialization_query(parameters)
-    assert sql == "CREATE UNIQUE INDEX merge_index ON {{table}}(col_1 text(4),col_2 text(15))"
+    assert sql == "CREATE UNIQUE INDEX IF NOT EXISTS merge_index ON {{table}}(col_1 text(4),col_2 text(15))"
+
+
+def test_load_pandas_dataframe_to_table_with_more_values_than_sqlite_variables(tmp_path):
+    """Test that loading more values than the Sqlite bound variables limit, then appending to it, works"""
+    database = SqliteDatabase()
+    database.sqlalchemy_engine = create_engine(f"sqlite:///{tmp_path / 'sqlite.db'}")
+    dataframe = pd.DataFrame({"id": range(1000), "name": ["name"] * 1000})
+
+    database.load_pandas_dataframe_to_table(source_dataframe=dataframe, target_table=Table(name="my_table"))
+    database.load_pandas_dataframe_to_table(
+        source_dataframe=dataframe, target_table=Table(name="my_table"), if_exists="append"
+    )
+
+    count = pd.read_sql("SELECT COUNT(*) AS count FROM my_table", con=database.sqlalchemy_engine)["count"][0]
+    assert count == 2000
+
+
+def test_is_native_load_file_available_requires_opt_in(tmp_path):
+    """Local CSV files are loaded with pandas unless the native Sqlite CSV load is enabled"""
+    source_file = File(str(tmp_path / "sample.csv"))
+    target_table = Table(name="my_table")
+
+    database = SqliteDatabase()
+    assert not database.is_native_load_file_available(source_file=source_file, target_table=target_table)
+    database = SqliteDatabase(load_options=SqliteLoadOptions(use_native_csv_load=True))
+    assert database.is_native_load_file_available(source_file=source_file, target_table=target_table)
+
+
+def test_load_file_to_table_natively_streams_local_csv(tmp_path):
+    """Local CSV files are inserted into an existing table without going through pandas"""
+    database = SqliteDatabase(load_options=SqliteLoadOptions(use_native_csv_load=True))
+    database.sqlalchemy_engine = create_engine(f"sqlite:///{tmp_path / 'sqlite.db'}")
+    database.run_sql("CREATE TABLE my_table (id BIGINT, name TEXT)")
+    source_file = File(str(tmp_path / "sample.csv"))
+    pathlib.Path(source_file.path).write_text("\ufeffid,name\n1,First\n2,\n", encoding="utf-8")
+
+    database.load_file_to_table_natively(source_file=source_file, target_table=Table(name="my_table"))
+
+    df = pd.read_sql("SELECT * FROM my_table ORDER BY id", con=database.sqlalchemy_engine)
+    assert df["id"].tolist() == [1, 2]
+    assert df["name"].tolist() == ["First", None]
+
+
+def test_load_file_to_table_natively_quotes_header_names(tmp_path):
+    """CSV header names holding double quotes are escaped in the generated statement"""
+    database = SqliteDatabase(load_options=SqliteLoadOptions(use_native_csv_load=True))
+    database.sqlalchemy_engine = create_engine(f"sqlite:///{tmp_path / 'sqlite.db'}")
+    database.run_sql('CREATE TABLE my_table (id BIGINT, "na""me" TEXT)')
+    source_file = File(str(tmp_path / "sample.csv"))
+    pathlib.Path(source_file.path).write_text('id,"na""me"\n1,First\n', encoding="utf-8")
+
+    database.load_file_to_table_natively(source_file=source_file, target_table=Table(name="my_table"))
+
+    df = pd.read_sql("SELECT * FROM my_table", con=database.sqlalchemy_engine)
+    assert df.columns.tolist() == ["id", 'na"me']
+    assert df['na"me'].tolist() == ["First"]
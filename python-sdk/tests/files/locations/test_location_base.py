@@ -1,10 +1,13 @@
 import os
 import uuid
+from unittest import mock
 
 import pytest
+from airflow.models import Connection
 
 from astro.constants import FileLocation
 from astro.files.locations import create_file_location, get_class_name
+from astro.files.locations.base import get_conn_type
 from astro.files.locations.google.gcs import GCSLocation
 from astro.files.locations.local import LocalLocation
 
@@ -148,3 +151,15 @@ def test_invalid_conn_id_with_file_path():
     """Raise a value when the connection types doesn't match the path"""
     with pytest.raises(ValueError, match=r".* is not supported for .*"):
         GCSLocation("gs://tmp/file_a.csv", conn_id="aws_default")
+
+
+@mock.patch("astro.files.locations.base.BaseHook.get_connection")
+def test_conn_type_is_looked_up_once_per_connection(get_connection):
+    """Test that building several locations for the same connection only fetches it once"""
+    get_conn_type.cache_clear()
+    get_connection.return_value = Connection(conn_id="gcp_conn", conn_type="google_cloud_platform")
+
+    GCSLocation("gs://tmp/file_a.csv", conn_id="gcp_conn")
+    GCSLocation("gs://tmp/file_b.csv", conn_id="gcp_conn")
+    get_connection.assert_called_once_with("gcp_conn")
+    get_conn_type.cache_clear()
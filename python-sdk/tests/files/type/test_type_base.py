@@ -3,7 +3,7 @@ import pathlib
 import pytest
 
 from astro.constants import FileType
-from astro.files.types import get_filetype
+from astro.files.types import FILETYPE_TO_CLASS, _get_filetype_from_path, create_file_type, get_filetype
 
 sample_file = pathlib.Path(pathlib.Path(__file__).parent.parent, "data/sample.csv")
 sample_filepaths_per_filetype = [
@@ -44,3 +44,52 @@ def test_get_filetype_with_unsupported_filetype_raises_exception():
         get_filetype(unsupported_filetype)
     expected_msg = "Unsupported filetype 'inexistent' from file 'sample.inexistent'."
     assert exc_info.value.args[0] == expected_msg
+
+
+@pytest.mark.parametrize("filetype", list(FileType), ids=lambda filetype: filetype.value)
+def test_create_file_type_uses_dispatch_table(filetype):
+    """Test create_file_type returns an instance of the class registered for the given filetype."""
+    file_type = create_file_type(path=f"sample.{filetype.value}", filetype=filetype)
+    assert type(file_type) is FILETYPE_TO_CLASS[filetype]
+
+
+def test_create_file_type_with_unsupported_filetype_raises_exception():
+    """Test create_file_type lists the supported file types when given an unknown one."""
+    with pytest.raises(ValueError) as exc_info:
+        create_file_type(path="sample.inexistent", filetype="inexistent")
+    expected_msg = (
+        "Non supported file type provided inexistent, file_type should be among "
+        "csv, json, ndjson, parquet, xls, xlsx."
+    )
+    assert exc_info.value.args[0] == expected_msg
+
+
+@pytest.mark.parametrize(
+    "filepath",
+    [
+        "/tmp/some.dir/sample.csv",
+        "s3://fake.bucket/some/sample.csv",
+        pathlib.PurePosixPath("/tmp/some.dir/sample.csv"),
+        pathlib.PureWindowsPath("C:\\some.dir\\sample.csv"),
+    ],
+)
+def test_get_filetype_ignores_dots_in_parent_directories(filepath):
+    """Test the file type is only inferred from the extension of the last path component."""
+    assert get_filetype(filepath) == FileType.CSV
+
+
+def test_get_filetype_with_dotted_directory_and_no_extension():
+    """Test a dot in a parent directory is not mistaken for the file extension."""
+    with pytest.raises(ValueError) as exc_info:
+        get_filetype("s3://fake.bucket/fake-object")
+    assert "Missing file extension" in exc_info.value.args[0]
+
+
+def test_get_filetype_is_cached_for_equivalent_paths():
+    """Test string and pathlib inputs for the same path share a single cache entry."""
+    _get_filetype_from_path.cache_clear()
+    get_filetype("/tmp/cached/sample.parquet")
+    get_filetype(pathlib.PurePosixPath("/tmp/cached/sample.parquet"))
+    cache_info = _get_filetype_from_path.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
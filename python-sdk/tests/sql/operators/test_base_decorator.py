@@ -72,3 +72,36 @@ def test_base_sql_decorated_operator_template_fields_and_template_ext_with_sql()
     """
     assert "sql" in BaseSQLDecoratedOperator.template_fields
     assert ".sql" in BaseSQLDecoratedOperator.template_ext
+
+
+def test_move_function_params_into_sql_params_builds_jinja_env_once():
+    """Test that all the parameters are rendered with the same Jinja environment"""
+    operator = BaseSQLDecoratedOperator(
+        task_id="test", python_callable=lambda: 1, parameters={"a": "{{ ds }}", "b": "{{ ds }}", "c": 1}
+    )
+
+    with mock.patch.object(
+        BaseSQLDecoratedOperator, "get_template_env", wraps=operator.get_template_env
+    ) as mock_get_template_env:
+        operator.move_function_params_into_sql_params(context={"ds": "2022-01-01"})
+
+    mock_get_template_env.assert_called_once()
+    assert operator.parameters == {"a": "2022-01-01", "b": "2022-01-01", "c": 1}
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("SELECT 1", False),
+        ("{{ ds }}", True),
+        ("{% if true %}1{% endif %}", True),
+        ("query.sql", True),
+        (1, False),
+        (None, False),
+        (Table(name="{{ ds }}"), True),
+    ],
+)
+def test_is_templated(value, expected):
+    """Test that only values which may hold Jinja templates are rendered"""
+    operator = BaseSQLDecoratedOperator(task_id="test", python_callable=lambda: 1)
+    assert operator._is_templated(value) is expected
@@ -53,6 +53,26 @@ def test_columns_params(test_columns, expected_columns):
         )
 
 
+def test_key_range_predicates_are_ignored_by_unsupported_databases():
+    """Test that asking for merge key range predicates on a database without support merges as usual"""
+    source_table = Table(name="source_table", conn_id="test1", metadata=Metadata(schema="test"))
+    target_table = Table(name="target_table", conn_id="test2", metadata=Metadata(schema="test"))
+    merge_task = MergeOperator(
+        source_table=source_table,
+        target_table=target_table,
+        if_conflicts="ignore",
+        target_conflict_columns=["list"],
+        columns=["list"],
+        use_key_range_predicates=True,
+    )
+    with mock.patch("astro.databases.sqlite.SqliteDatabase.merge_table") as mock_merge, mock.patch.dict(
+        os.environ,
+        {"AIRFLOW_CONN_TEST1": "sqlite://", "AIRFLOW_CONN_TEST2": "sqlite://"},
+    ):
+        merge_task.execute(context=create_context(merge_task))
+    assert "use_key_range_predicates" not in mock_merge.call_args.kwargs
+
+
 def test_invalid_columns_param():
     """Test that an error is raised when an invalid columns type is passed"""
     source_table = Table(name="source_table", conn_id="test1", metadata=Metadata(schema="test"))
@@ -62,8 +62,9 @@ def get_default_parameters(database_name):
 
 
 def get_table_name(prefix):
-    """get unique table name"""
-    return prefix + "_" + str(int(time.time()))
+    """get unique table name, also across pytest-xdist workers running at the same time"""
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    return f"{prefix}_{worker_id}_{int(time.time())}"
 
 
 def run_dag(dag: DAG) -> DagRun:
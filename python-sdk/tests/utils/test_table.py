@@ -1,10 +1,11 @@
+import inspect
 from unittest import mock
 
 import pytest
 
 from astro.sql.operators.transform import TransformOperator
 from astro.table import BaseTable, Table
-from astro.utils.table import find_first_table
+from astro.utils.table import find_first_table, get_callable_parameters
 
 
 @pytest.mark.parametrize(
@@ -89,3 +90,16 @@ def test_find_first_table(kwargs, return_type):
 @mock.patch("airflow.models.xcom_arg.PlainXComArg.resolve", return_value=Table(), autospec=True)
 def test_find_first_table_with_xcom_arg(xcom_arg_resolve, kwargs, return_type):
     assert isinstance(find_first_table(context={}, **kwargs), return_type)
+
+
+def test_get_callable_parameters_is_cached():
+    """Test that the signature of a callable is only introspected once"""
+
+    def my_function(a, b=1):  # skipcq: PY-D0003
+        return a, b
+
+    with mock.patch("astro.utils.table.inspect.signature", wraps=inspect.signature) as mock_signature:
+        assert list(get_callable_parameters(my_function)) == ["a", "b"]
+        assert list(get_callable_parameters(my_function)) == ["a", "b"]
+
+    mock_signature.assert_called_once_with(my_function)
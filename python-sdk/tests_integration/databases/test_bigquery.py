@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 import pandas as pd
 import pytest
 import sqlalchemy
+from google.cloud import bigquery
 
 from astro.constants import Database
 from astro.databases import create_database
@@ -374,19 +375,19 @@ def test_create_table_from_select_statement(database_table_fixture):
     indirect=True,
     ids=["bigquery"],
 )
-@mock.patch("astro.databases.google.bigquery.pd.DataFrame.to_gbq")
-def test_load_pandas_dataframe_to_table_with_service_account(mock_to_gbq, database_table_fixture):
-    """Test loading a pandas dataframe to a table with service account authentication."""
+def test_load_pandas_dataframe_to_table_as_parquet(database_table_fixture):
+    """Test loading a pandas dataframe to a table uploads it as Parquet using the hook client."""
     database, target_table = database_table_fixture
-    # Skip running _get_credentials. We assume we always will get a Credentials object back.
-    database.hook._get_credentials = mock.Mock()
+    database.hook.get_client = mock.Mock()
     df = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
     database.load_pandas_dataframe_to_table(df, target_table)
 
-    mock_to_gbq.assert_called_once()
-    _, kwargs = mock_to_gbq.call_args
-    # Check that we are using service account authentication i.e. by passing not None.
-    assert kwargs["credentials"] is not None
+    load_table_from_file = database.hook.get_client.return_value.load_table_from_file
+    load_table_from_file.assert_called_once()
+    _, kwargs = load_table_from_file.call_args
+    assert kwargs["destination"] == database.get_table_qualified_name(target_table)
+    assert kwargs["job_config"].source_format == bigquery.SourceFormat.PARQUET
+    assert kwargs["job_config"].write_disposition == "WRITE_TRUNCATE"
 
 
 @pytest.mark.integration
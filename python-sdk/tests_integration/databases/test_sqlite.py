@@ -1,6 +1,7 @@
 import os
 import pathlib
 
+import numpy as np
 import pandas as pd
 import pytest
 import sqlalchemy
@@ -31,9 +32,15 @@ def test_create_database(conn_id):
     assert isinstance(database, SqliteDatabase)
 
 
+@pytest.fixture(scope="module")
+def sqlite_database(request):
+    """Share a single SqliteDatabase, and therefore its engine, per conn_id across this module's tests."""
+    return SqliteDatabase(request.param)
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
-    "conn_id,expected_db_path",
+    "sqlite_database,expected_db_path",
     [
         (
             DEFAULT_CONN_ID,
@@ -41,12 +48,12 @@ def test_create_database(conn_id):
         ),  # Linux and MacOS have different hosts
         (CUSTOM_CONN_ID, "/tmp/sqlite.db"),
     ],
+    indirect=["sqlite_database"],
     ids=SUPPORTED_CONN_IDS,
 )
-def test_sqlite_sqlalchemy_engine(conn_id, expected_db_path):
+def test_sqlite_sqlalchemy_engine(sqlite_database, expected_db_path):
     """Confirm that the SQLAlchemy is created successfully and verify DB path."""
-    database = SqliteDatabase(conn_id)
-    engine = database.sqlalchemy_engine
+    engine = sqlite_database.sqlalchemy_engine
     assert isinstance(engine, sqlalchemy.engine.base.Engine)
     assert engine.url.database == expected_db_path
 
@@ -175,7 +182,7 @@ def test_load_pandas_dataframe_to_table(database_table_fixture):
     """Load Pandas Dataframe to a SQL table"""
     database, table = database_table_fixture
 
-    pandas_dataframe = pd.DataFrame(data={"id": [1, 2]})
+    pandas_dataframe = pd.DataFrame(data={"id": np.array([1, 2], dtype=np.int64)})
     database.load_pandas_dataframe_to_table(pandas_dataframe, table)
 
     statement = f"SELECT * FROM {table.name};"
@@ -204,13 +211,7 @@ def test_load_file_to_table(database_table_fixture):
 
     df = database.hook.get_pandas_df(f"SELECT * FROM {target_table.name}")
     assert len(df) == 3
-    expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 3, "name": "Third with unicode पांचाल"},
-        ]
-    )
+    expected = test_utils.SAMPLE_DATAFRAME.copy()
     test_utils.assert_dataframes_are_equal(df, expected)
 
 
@@ -235,13 +236,7 @@ def test_export_table_to_file_overrides_existing_file(database_table_fixture):
 
     df = test_utils.load_to_dataframe(filepath, "csv")
     assert len(df) == 3
-    expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 3, "name": "Third with unicode पांचाल"},
-        ]
-    )
+    expected = test_utils.SAMPLE_DATAFRAME.copy()
     assert df.rename(columns=str.lower).equals(expected)
 
 
@@ -297,13 +292,7 @@ def test_export_table_to_file_in_the_cloud(database_table_fixture, remote_files_
     filepath = copy_remote_file_to_local(object_path)
     df = pd.read_csv(filepath)
     assert len(df) == 3
-    expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 3, "name": "Third with unicode पांचाल"},
-        ]
-    )
+    expected = test_utils.SAMPLE_DATAFRAME.copy()
     test_utils.assert_dataframes_are_equal(df, expected)
     os.remove(filepath)
 
@@ -1,6 +1,7 @@
 import os
 import pathlib
 from unittest import mock
+from urllib.parse import urlparse
 
 import pandas as pd
 import pytest
@@ -11,6 +12,7 @@ from pandas._testing import assert_frame_equal
 
 from astro import sql as aql
 from astro.constants import Database, FileType
+from astro.databases.aws.redshift import REDSHIFT_MAX_BIND_PARAMETERS
 from astro.dataframes.load_options import PandasCsvLoadOptions, PandasLoadOptions
 from astro.dataframes.pandas import PandasDataframe
 from astro.exceptions import DatabaseCustomError
@@ -25,6 +27,7 @@ from ..operators import utils as test_utils
 
 OUTPUT_TABLE_NAME = test_utils.get_table_name("load_file_test_table")
 CWD = pathlib.Path(__file__).parent
+DATA_DIR = CWD.parent.parent / "data"
 
 
 def is_dict_subset(superset: dict, subset: dict) -> bool:
@@ -173,35 +176,35 @@ def test_aql_load_remote_file_to_dbs(sample_dag, database_table_fixture, remote_
     [
         {
             "database": Database.SNOWFLAKE,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
         {
             "database": Database.BIGQUERY,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
         {
             "database": Database.POSTGRES,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
         {
             "database": Database.SQLITE,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
         {
             "database": Database.REDSHIFT,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
         {
             "database": Database.MSSQL,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
         {
             "database": Database.MYSQL,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
         {
             "database": Database.DUCKDB,
-            "file": File(path=str(CWD) + "/../../data/homes2.csv"),
+            "file": File(path=str(DATA_DIR / "homes2.csv")),
         },
     ],
     indirect=True,
@@ -213,8 +216,8 @@ def test_aql_replace_existing_table(sample_dag, database_table_fixture, request)
     test_id = request.node.callspec.id
 
     db, test_table = database_table_fixture
-    data_path_1 = str(CWD) + "/../../data/homes.csv"
-    data_path_2 = str(CWD) + "/../../data/homes2.csv"
+    data_path_1 = str(DATA_DIR / "homes.csv")
+    data_path_2 = str(DATA_DIR / "homes2.csv")
     with sample_dag:
         # Bigquery rate limits the number of tables operations per 10s to 5 table operations.
         # See more here: https://cloud.google.com/bigquery/quotas#standard_tables
@@ -271,7 +274,7 @@ def test_aql_replace_existing_table(sample_dag, database_table_fixture, request)
 )
 def test_aql_local_file_with_no_table_name(sample_dag, database_table_fixture):
     db, test_table = database_table_fixture
-    data_path = str(CWD) + "/../../data/homes.csv"
+    data_path = str(DATA_DIR / "homes.csv")
     with sample_dag:
         load_file(input_file=File(data_path), output_table=test_table)
     test_utils.run_dag(sample_dag)
@@ -307,7 +310,7 @@ def test_aql_local_file_with_no_table_name(sample_dag, database_table_fixture):
 )
 def test_aql_load_file_pattern(remote_files_fixture, sample_dag, database_table_fixture):
     remote_object_uri = remote_files_fixture[0]
-    filename = pathlib.Path(CWD.parent, "../data/sample.csv")
+    filename = DATA_DIR / "sample.csv"
     db, test_table = database_table_fixture
 
     with sample_dag:
@@ -338,14 +341,14 @@ def test_aql_load_file_pattern(remote_files_fixture, sample_dag, database_table_
     ids=["postgres", "mysql"],
 )
 def test_aql_load_file_local_file_pattern(sample_dag, database_table_fixture):
-    filename = str(CWD.parent) + "/../data/homes_pattern_1.csv"
+    filename = str(DATA_DIR / "homes_pattern_1.csv")
     db, test_table = database_table_fixture
 
     test_df_rows = pd.read_csv(filename).shape[0]
 
     with sample_dag:
         load_file(
-            input_file=File(path=str(CWD.parent) + "/../data/homes_pattern_*", filetype=FileType.CSV),
+            input_file=File(path=str(DATA_DIR / "homes_pattern_*"), filetype=FileType.CSV),
             output_table=test_table,
         )
     test_utils.run_dag(sample_dag)
@@ -356,13 +359,11 @@ def test_aql_load_file_local_file_pattern(sample_dag, database_table_fixture):
 
 
 def test_aql_load_file_local_file_pattern_dataframe(sample_dag):
-    filename = str(CWD.parent) + "/../data/homes_pattern_1.csv"
-    filename_2 = str(CWD.parent) + "/../data/homes_pattern_2.csv"
+    filename = str(DATA_DIR / "homes_pattern_1.csv")
+    filename_2 = str(DATA_DIR / "homes_pattern_2.csv")
 
-    test_df = pd.read_csv(filename)
-    test_df_2 = pd.read_csv(filename_2)
-    test_df = pd.concat([test_df, test_df_2])
-    test_df.reset_index(drop=True, inplace=True)
+    test_df = pd.concat([pd.read_csv(filename), pd.read_csv(filename_2)], copy=False, ignore_index=True)
+    expected_sorted = test_df.sort_values("sell", ignore_index=True)
 
     from airflow.decorators import task
 
@@ -370,14 +371,12 @@ def test_aql_load_file_local_file_pattern_dataframe(sample_dag):
     def validate(input_df):
         assert isinstance(input_df, pd.DataFrame)
         assert test_df.shape == input_df.shape
-        assert test_df.sort_values("sell", ignore_index=True).equals(
-            input_df.sort_values("sell", ignore_index=True)
-        )
+        assert expected_sorted.equals(input_df.sort_values("sell", ignore_index=True))
         print(input_df)
 
     with sample_dag:
         loaded_df = load_file(
-            input_file=File(path=str(CWD.parent) + "/../data/homes_pattern_*", filetype=FileType.CSV),
+            input_file=File(path=str(DATA_DIR / "homes_pattern_*"), filetype=FileType.CSV),
         )
         validate(loaded_df)
 
@@ -498,22 +497,15 @@ def test_load_file_with_named_schema(sample_dag, database_table_fixture, file_ty
 
     with sample_dag:
         load_file(
-            input_file=File(path=str(pathlib.Path(CWD.parent, f"../data/sample.{file_type}"))),
+            input_file=File(path=str(DATA_DIR / f"sample.{file_type}")),
             output_table=test_table,
         )
     test_utils.run_dag(sample_dag)
     df = db.export_table_to_pandas_dataframe(test_table)
     assert len(df) == 3
-    expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 3, "name": "Third with unicode पांचाल"},
-        ]
-    )
-    df = df.rename(columns=str.lower)
-    df = df.astype({"id": "int64"})
-    expected = expected.astype({"id": "int64"})
+    expected = test_utils.SAMPLE_DATAFRAME.copy()
+    df.columns = df.columns.str.lower()
+    df["id"] = df["id"].astype("int64", copy=False)
     assert_frame_equal(df, expected)
 
 
@@ -538,7 +530,7 @@ def test_load_file_with_named_schema_for_mssql(sample_dag, database_table_fixtur
     with sample_dag:
         load_file(
             input_file=File(
-                path=str(pathlib.Path(CWD.parent, f"../data/sample_without_unicode.{file_type}"))
+                path=str(DATA_DIR / f"sample_without_unicode.{file_type}")
             ),
             output_table=test_table,
         )
@@ -551,8 +543,8 @@ def test_load_file_with_named_schema_for_mssql(sample_dag, database_table_fixtur
             {"id": 2, "name": "Second"},
         ]
     )
-    df = df.rename(columns=str.lower)
-    df = df.astype({"id": "int64"})
+    df.columns = df.columns.str.lower()
+    df["id"] = df["id"].astype("int64", copy=False)
     expected = expected.astype({"id": "int64"})
     assert_frame_equal(df, expected)
 
@@ -564,28 +556,23 @@ def test_load_file_with_named_schema_for_mssql(sample_dag, database_table_fixtur
         {
             "database": Database.SNOWFLAKE,
         },
-        {
-            "database": Database.BIGQUERY,
-        },
         {
             "database": Database.REDSHIFT,
         },
     ],
     indirect=True,
-    ids=["snowflake", "bigquery", "redshift"],
+    ids=["snowflake", "redshift"],
 )
 def test_load_file_chunks(sample_dag, database_table_fixture):
     file_type = "csv"
     db, test_table = database_table_fixture
 
     chunk_function = {
-        "bigquery": "pandas.DataFrame.to_gbq",
         "snowflake": "snowflake.connector.pandas_tools.write_pandas",
         "redshift": "pandas.DataFrame.to_sql",
     }[db.sql_type]
 
     chunk_size_argument = {
-        "bigquery": "chunksize",
         "snowflake": "chunk_size",
         "redshift": "chunksize",
     }[db.sql_type]
@@ -594,14 +581,20 @@ def test_load_file_chunks(sample_dag, database_table_fixture):
         chunk_function
     ) as mock_chunk_function, sample_dag as trail_dag:
         load_file(
-            input_file=File(path=str(pathlib.Path(CWD.parent, f"../data/sample.{file_type}"))),
+            input_file=File(path=str(DATA_DIR / f"sample.{file_type}")),
             output_table=test_table,
             use_native_support=False,
         )
         test_utils.run_dag(trail_dag)
 
+    expected_chunk_size = {
+        "snowflake": 1000000,
+        # The two columns of the sample file bind two parameters per row of each multi-row INSERT
+        "redshift": REDSHIFT_MAX_BIND_PARAMETERS // 2,
+    }[db.sql_type]
+
     _, kwargs = mock_chunk_function.call_args
-    assert kwargs[chunk_size_argument] == 1000000
+    assert kwargs[chunk_size_argument] == expected_chunk_size
 
 
 @pytest.mark.integration
@@ -667,7 +660,7 @@ def test_loading_local_file_to_database(database_table_fixture):
     """
     Verify that the optimised path method is skipped in case use_native_support is set to False.
     """
-    path = str(CWD) + "/../../data/homes_main.csv"
+    path = str(DATA_DIR / "homes_main.csv")
     db, test_table = database_table_fixture
     load_file_task = load_file(
         input_file=File(path),
@@ -688,27 +681,27 @@ def test_loading_local_file_to_database(database_table_fixture):
     "text_cases",
     [
         {
-            "path": "/../../data/homes_upper.csv",
+            "path": "homes_upper.csv",
             "expected_result": ["Acres", "Age", "Baths", "Beds", "List", "Living", "Rooms", "Sell", "Taxes"],
             "sql": 'SELECT "Age" From <table_name>',
         },
         {
-            "path": "/../../data/homes2.csv",
+            "path": "homes2.csv",
             "expected_result": ["acres", "age", "baths", "beds", "list", "living", "rooms", "sell", "taxes"],
             "sql": "SELECT age From <table_name>",
         },
         {
-            "path": "/../../data/homes2.csv",
+            "path": "homes2.csv",
             "expected_result": ["acres", "age", "baths", "beds", "list", "living", "rooms", "sell", "taxes"],
             "sql": "SELECT AGE From <table_name>",
         },
         {
-            "path": "/../../data/homes_uppercase.csv",
+            "path": "homes_uppercase.csv",
             "expected_result": ["acres", "age", "baths", "beds", "list", "living", "rooms", "sell", "taxes"],
             "sql": "SELECT age From <table_name>",
         },
         {
-            "path": "/../../data/homes_uppercase.csv",
+            "path": "homes_uppercase.csv",
             "expected_result": ["acres", "age", "baths", "beds", "list", "living", "rooms", "sell", "taxes"],
             "sql": "SELECT AGE From <table_name>",
         },
@@ -737,7 +730,7 @@ def test_load_file_col_cap(sample_dag, database_table_fixture, text_cases):
     We use pandas path for this.
     """
     db, test_table = database_table_fixture
-    path = str(CWD) + text_cases["path"]
+    path = str(DATA_DIR / text_cases["path"])
 
     @aql.run_raw_sql()
     def validate_run_raw_sql(table):
@@ -776,7 +769,7 @@ def test_load_file_col_cap_native_path(sample_dag, database_table_fixture):
     We use native path for this.
     """
     db, test_table = database_table_fixture
-    path = str(CWD) + "/../../data/homes_upper.csv"
+    path = str(DATA_DIR / "homes_upper.csv")
     with sample_dag:
         load_file(
             input_file=File(path),
@@ -856,7 +849,7 @@ def test_load_file(sample_dag, database_table_fixture, file_type):
     # used requires other optional params by local to Bigquery native path.
     with sample_dag:
         load_file(
-            input_file=File(path=str(pathlib.Path(CWD.parent, f"../data/sample.{file_type}"))),
+            input_file=File(path=str(DATA_DIR / f"sample.{file_type}")),
             output_table=test_table,
             use_native_support=False,
         )
@@ -865,16 +858,9 @@ def test_load_file(sample_dag, database_table_fixture, file_type):
     df = db.export_table_to_pandas_dataframe(test_table)
 
     assert len(df) == 3
-    expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 3, "name": "Third with unicode पांचाल"},
-        ]
-    )
-    df = df.rename(columns=str.lower)
-    df = df.astype({"id": "int64"})
-    expected = expected.astype({"id": "int64"})
+    expected = test_utils.SAMPLE_DATAFRAME.copy()
+    df.columns = df.columns.str.lower()
+    df["id"] = df["id"].astype("int64", copy=False)
     assert_frame_equal(df, expected)
 
 
@@ -896,7 +882,7 @@ def test_load_file_for_mssql(sample_dag, database_table_fixture, file_type):
     with sample_dag:
         load_file(
             input_file=File(
-                path=str(pathlib.Path(CWD.parent, f"../data/sample_without_unicode.{file_type}"))
+                path=str(DATA_DIR / f"sample_without_unicode.{file_type}")
             ),
             output_table=test_table,
             use_native_support=False,
@@ -912,8 +898,8 @@ def test_load_file_for_mssql(sample_dag, database_table_fixture, file_type):
             {"id": 2, "name": "Second"},
         ]
     )
-    df = df.rename(columns=str.lower)
-    df = df.astype({"id": "int64"})
+    df.columns = df.columns.str.lower()
+    df["id"] = df["id"].astype("int64", copy=False)
     expected = expected.astype({"id": "int64"})
     assert_frame_equal(df, expected)
 
@@ -957,7 +943,7 @@ def test_aql_nested_ndjson_file_with_default_sep_param(sample_dag, database_tabl
         # Using the use_native_support=False here since the dataset
         # used requires other optional params by local to Bigquery native path.
         load_file(
-            input_file=File(path=str(CWD) + "/../../data/github_single_level_nested.ndjson"),
+            input_file=File(path=str(DATA_DIR / "github_single_level_nested.ndjson")),
             output_table=test_table,
             use_native_support=False,
         )
@@ -978,7 +964,7 @@ def test_populate_table_metadata(sample_dag):
 
     with sample_dag:
         output_table = load_file(
-            input_file=File(path=str(pathlib.Path(CWD.parent, "../data/sample.csv"))),
+            input_file=File(path=str(DATA_DIR / "sample.csv")),
             output_table=Table(conn_id="postgres_conn_pagila"),
         )
         validate(output_table)
@@ -997,7 +983,7 @@ def test_populate_table_metadata_mssql(sample_dag):
 
     with sample_dag:
         output_table = load_file(
-            input_file=File(path=str(pathlib.Path(CWD.parent, "../data/sample_without_unicode.csv"))),
+            input_file=File(path=str(DATA_DIR / "sample_without_unicode.csv")),
             output_table=Table(conn_id="mssql_conn"),
         )
         validate(output_table)
@@ -1090,10 +1076,7 @@ def test_aql_load_file_optimized_path_method_called(sample_dag, database_table_f
         },
     }
 
-    if file_uri.find(":") >= 0:
-        source = file_uri.split(":")[0]
-    else:
-        source = "local"
+    source = urlparse(file_uri).scheme or "local"
 
     destination = db.sql_type
     mock_path = optimised_path_to_method[(source, destination)]["method_path"]
@@ -1160,10 +1143,7 @@ def test_aql_load_file_optimized_path_method_is_not_called(
             "method_path": "astro.databases.google.bigquery.BigqueryDatabase.load_local_file_to_table",
         },
     }
-    if file_uri.find(":") >= 0:
-        source = file_uri.split(":")[0]
-    else:
-        source = "local"
+    source = urlparse(file_uri).scheme or "local"
     destination = db.sql_type
     mock_path = optimised_path_to_method[(source, destination)]["method_path"]
 
@@ -1271,7 +1251,7 @@ def test_aql_nested_ndjson_file_to_database_explicit_sep_params(sample_dag, data
         # Using the use_native_support=False here since the dataset
         # used requires other optional params by local to Bigquery native path.
         load_file(
-            input_file=File(path=str(CWD) + "/../../data/github_single_level_nested.ndjson"),
+            input_file=File(path=str(DATA_DIR / "github_single_level_nested.ndjson")),
             output_table=test_table,
             use_native_support=False,
             ndjson_normalize_sep="___",
@@ -1400,7 +1380,7 @@ def test_aql_nested_ndjson_file_to_database_explicit_illegal_sep_params(sample_d
         # Using the use_native_support=False here since the dataset
         # used requires other optional params by local to Bigquery native path.
         load_file(
-            input_file=File(path=str(CWD) + "/../../data/github_single_level_nested.ndjson"),
+            input_file=File(path=str(DATA_DIR / "github_single_level_nested.ndjson")),
             output_table=test_table,
             ndjson_normalize_sep=".",
             use_native_support=False,
@@ -1426,7 +1406,7 @@ def test_aql_nested_ndjson_file_to_database_explicit_illegal_sep_params(sample_d
 def test_load_file_delimiter(sample_dag, database_table_fixture):
     _, test_table = database_table_fixture
 
-    path = str(CWD) + "/../../data/delimiter_dollar.csv"
+    path = str(DATA_DIR / "delimiter_dollar.csv")
 
     with sample_dag:
         load_file(
@@ -1452,7 +1432,7 @@ def test_load_file_delimiter_with_deprecated_load_options(sample_dag, database_t
     """Test passing of a single LoadOptions instance instead of list with deprecated PandasCsvLoadOptions"""
     _, test_table = database_table_fixture
 
-    path = str(CWD) + "/../../data/delimiter_dollar.csv"
+    path = str(DATA_DIR / "delimiter_dollar.csv")
 
     with sample_dag:
         load_file(
@@ -1478,7 +1458,7 @@ def test_tables_creation_if_they_dont_exist_mssql(database_table_fixture, if_exi
     """
     Verify creation of new tables in case we pass if_exists=replace/append
     """
-    path = str(CWD) + "/../../data/homes_main.csv"
+    path = str(DATA_DIR / "homes_main.csv")
     db, test_table = database_table_fixture
     load_file_task = load_file(input_file=File(path), output_table=test_table, if_exists=if_exists)
     load_file_task.operator.execute(context=create_context(load_file_task.operator))
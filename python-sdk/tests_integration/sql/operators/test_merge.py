@@ -1,7 +1,7 @@
-import math
 import pathlib
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from airflow.decorators import task_group
@@ -16,6 +16,13 @@ from astro.table import Metadata, Table
 from ..operators import utils as test_utils
 
 CWD = pathlib.Path(__file__).parent
+DATA_DIR = CWD.parent.parent / "data"
+HOMES_MERGE_1_CSV = str(DATA_DIR / "homes_merge_1.csv")
+HOMES_MERGE_2_CSV = str(DATA_DIR / "homes_merge_2.csv")
+SAMPLE_CSV = str(DATA_DIR / "sample.csv")
+SAMPLE_PART2_CSV = str(DATA_DIR / "sample_part2.csv")
+SAMPLE_WITHOUT_UNICODE_CSV = str(DATA_DIR / "sample_without_unicode.csv")
+SAMPLE_PART2_WITHOUT_UNICODE_CSV = str(DATA_DIR / "sample_part2_without_unicode.csv")
 
 
 @aql.run_raw_sql
@@ -74,25 +81,25 @@ def run_merge(target_table: Table, source_table: Table, merge_parameters, mode):
 
 @aql.dataframe
 def validate_results(df: pd.DataFrame, mode):
-    def set_compare(l1, l2):
-        l1 = list(filter(lambda val: not math.isnan(val), l1))
-        return set(l1) == set(l2)
+    def set_compare(values, expected):
+        values = np.asarray(values, dtype=float)
+        return set(values[~np.isnan(values)].tolist()) == set(expected)
 
     df = df.sort_values(by=["list"], ascending=True)
 
     if mode == "single":
-        assert set_compare(df.age.to_list()[:-1], [60.0, 12.0, 41.0, 22.0])
-        assert set_compare(df.taxes.to_list()[:-1], [3167.0, 4033.0, 1471.0, 3204.0])
-        assert set_compare(df.list.to_list(), [160, 180, 132, 140, 240])
-        assert set_compare(df.sell.to_list()[:-1], [142, 175, 129, 138])
+        assert set_compare(df.age.iloc[:-1], [60.0, 12.0, 41.0, 22.0])
+        assert set_compare(df.taxes.iloc[:-1], [3167.0, 4033.0, 1471.0, 3204.0])
+        assert set_compare(df.list, [160, 180, 132, 140, 240])
+        assert set_compare(df.sell.iloc[:-1], [142, 175, 129, 138])
     elif mode == "multi":
-        assert set_compare(df.age.to_list()[:-1], [60.0, 12.0, 41.0, 22.0])
-        assert set_compare(df.taxes.to_list()[:-1], [3167.0, 4033.0, 1471.0, 3204.0])
-        assert set_compare(df.list.to_list(), [160, 180, 132, 140, 240])
-        assert set_compare(df.sell.to_list()[:-1], [142, 175, 129, 138])
+        assert set_compare(df.age.iloc[:-1], [60.0, 12.0, 41.0, 22.0])
+        assert set_compare(df.taxes.iloc[:-1], [3167.0, 4033.0, 1471.0, 3204.0])
+        assert set_compare(df.list, [160, 180, 132, 140, 240])
+        assert set_compare(df.sell.iloc[:-1], [142, 175, 129, 138])
     elif mode == "update":
         assert df.taxes.to_list() == [1, 1, 1, 1, 1]
-        assert set_compare(df.age.to_list()[:-1], [60.0, 12.0, 41.0, 22.0])
+        assert set_compare(df.age.iloc[:-1], [60.0, 12.0, 41.0, 22.0])
 
 
 # TODO: Add DuckDB for this test once https://github.com/astronomer/astro-sdk/issues/1713 is fixed
@@ -122,8 +129,8 @@ def validate_results(df: pd.DataFrame, mode):
     [
         {
             "items": [
-                {"file": File(str(pathlib.Path(CWD.parent.parent, "data/homes_merge_1.csv")))},
-                {"file": File(str(pathlib.Path(CWD.parent.parent, "data/homes_merge_2.csv")))},
+                {"file": File(HOMES_MERGE_1_CSV)},
+                {"file": File(HOMES_MERGE_2_CSV)},
             ]
         }
     ],
@@ -162,8 +169,8 @@ def test_merge(database_table_fixture, multiple_tables_fixture, sample_dag, merg
     [
         {
             "items": [
-                {"file": File(str(pathlib.Path(CWD.parent.parent, "data/sample.csv")))},
-                {"file": File(str(pathlib.Path(CWD.parent.parent, "data/sample_part2.csv")))},
+                {"file": File(SAMPLE_CSV)},
+                {"file": File(SAMPLE_PART2_CSV)},
             ]
         }
     ],
@@ -188,17 +195,14 @@ def test_merge_with_the_same_schema(database_table_fixture, multiple_tables_fixt
 
     test_utils.run_dag(sample_dag)
     computed = database.export_table_to_pandas_dataframe(first_table)
-    computed = computed.sort_values(by="id", ignore_index=True)
     expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 3, "name": "Third with unicode पांचाल"},
-            {"id": 4, "name": "Czwarte imię"},
-        ]
+        {
+            "id": [1, 2, 3, 4],
+            "name": ["First", "Second", "Third with unicode पांचाल", "Czwarte imię"],
+        }
     )
     assert first_table.row_count == 4
-    test_utils.assert_dataframes_are_equal(computed, expected)
+    test_utils.assert_dataframes_are_equal(computed, expected, index_column="id")
 
 
 @pytest.mark.integration
@@ -215,8 +219,8 @@ def test_merge_with_the_same_schema(database_table_fixture, multiple_tables_fixt
     [
         {
             "items": [
-                {"file": File(str(pathlib.Path(CWD.parent.parent, "data/sample_without_unicode.csv")))},
-                {"file": File(str(pathlib.Path(CWD.parent.parent, "data/sample_part2_without_unicode.csv")))},
+                {"file": File(SAMPLE_WITHOUT_UNICODE_CSV)},
+                {"file": File(SAMPLE_PART2_WITHOUT_UNICODE_CSV)},
             ]
         }
     ],
@@ -241,16 +245,9 @@ def test_merge_with_the_same_schema_on_mssql(database_table_fixture, multiple_ta
 
     test_utils.run_dag(sample_dag)
     computed = database.export_table_to_pandas_dataframe(first_table)
-    computed = computed.sort_values(by="id", ignore_index=True)
-    expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 4, "name": "Czwarte"},
-        ]
-    )
+    expected = pd.DataFrame({"id": [1, 2, 4], "name": ["First", "Second", "Czwarte"]})
     assert first_table.row_count == 3
-    test_utils.assert_dataframes_are_equal(computed, expected)
+    test_utils.assert_dataframes_are_equal(computed, expected, index_column="id")
 
 
 @pytest.mark.integration
@@ -272,14 +269,14 @@ def test_merge_with_the_same_schema_on_mssql(database_table_fixture, multiple_ta
                         conn_id="bigquery",
                         metadata=Metadata(schema="first_table_schema"),
                     ),
-                    "file": File(str(pathlib.Path(CWD.parent.parent, "data/sample.csv"))),
+                    "file": File(SAMPLE_CSV),
                 },
                 {
                     "table": Table(
                         conn_id="bigquery",
                         metadata=Metadata(schema="second_table_schema"),
                     ),
-                    "file": File(str(pathlib.Path(CWD.parent.parent, "data/sample_part2.csv"))),
+                    "file": File(SAMPLE_PART2_CSV),
                 },
             ]
         }
@@ -305,17 +302,14 @@ def test_merge_with_different_schemas(database_table_fixture, multiple_tables_fi
 
     test_utils.run_dag(sample_dag)
     computed = database.export_table_to_pandas_dataframe(first_table)
-    computed = computed.sort_values(by="id", ignore_index=True)
     expected = pd.DataFrame(
-        [
-            {"id": 1, "name": "First"},
-            {"id": 2, "name": "Second"},
-            {"id": 3, "name": "Third with unicode पांचाल"},
-            {"id": 4, "name": "Czwarte imię"},
-        ]
+        {
+            "id": [1, 2, 3, 4],
+            "name": ["First", "Second", "Third with unicode पांचाल", "Czwarte imię"],
+        }
     )
     assert first_table.row_count == 4
-    test_utils.assert_dataframes_are_equal(computed, expected)
+    test_utils.assert_dataframes_are_equal(computed, expected, index_column="id")
 
 
 sqlite_update_result_sql = (
@@ -49,6 +49,14 @@ SQL_SERVER_CONNECTION_KEY = {
     "mssql": "mssql_conn_id",
     "mysql": "mysql_conn_id",
 }
+# Expected content of the sample.* data files
+SAMPLE_DATAFRAME = pd.DataFrame(
+    [
+        {"id": 1, "name": "First"},
+        {"id": 2, "name": "Second"},
+        {"id": 3, "name": "Third with unicode पांचाल"},
+    ]
+).astype({"id": "int64"})
 
 
 def get_default_parameters(database_name):
@@ -61,8 +69,9 @@ def get_default_parameters(database_name):
 
 
 def get_table_name(prefix):
-    """get unique table name"""
-    return prefix + "_" + str(int(time.time()))
+    """get unique table name, also across pytest-xdist workers running at the same time"""
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    return f"{prefix}_{worker_id}_{int(time.time())}"
 
 
 def run_dag(dag: DAG) -> DagRun:
@@ -84,14 +93,22 @@ def load_to_dataframe(filepath, file_type):
         return read[file_type](fp, **read_params.get(file_type, {}))
 
 
-def assert_dataframes_are_equal(df: pd.DataFrame, expected: pd.DataFrame) -> None:
+def assert_dataframes_are_equal(
+    df: pd.DataFrame, expected: pd.DataFrame, index_column: str | None = None
+) -> None:
     """
     Auxiliary function to compare similarity of dataframes to avoid repeating this logic in many tests.
+
+    If ``index_column`` is given, rows are matched by that column instead of by position,
+    so the dataframes do not need to be sorted beforehand.
     """
     df = df.rename(columns=str.lower)
     df = df.astype({"id": "int64"})
     expected = expected.astype({"id": "int64"})
-    assert_frame_equal(df, expected)
+    if index_column is not None:
+        assert_frame_equal(df.set_index(index_column), expected.set_index(index_column), check_like=True)
+    else:
+        assert_frame_equal(df, expected)
 
 
 @provide_session